@@ -0,0 +1,91 @@
+from importlib import import_module
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from configparity.fields.common import ModelField  # noqa: E402
+from configparity.models.cisco.asa import ASA  # noqa: E402
+
+"""
+Measures what it costs to build one access-list entry while an ASA config is
+loaded, with ModelField resolving its model class once and caching it, and
+with the class resolved through import_module for every value the way it
+was before it was cached.
+
+    python benchmarks/entry_construction.py --entries 20000 --repeat 5
+"""
+
+
+def resolve_uncached(self):
+    if isinstance(self.model, type):
+        return self.model
+
+    path = self.model.split('.')
+    module = import_module('.' + path[-2], package='configparity.models.' + '.'.join(path[:-2]))
+
+    return getattr(module, path[-1])
+
+
+def build_config(entries):
+    lines = ['hostname BENCH']
+
+    for i in range(entries):
+        lines.append(f'access-list BENCH extended permit tcp host 10.{i // 62500}.{i // 250 % 250}.{i % 250 + 1} '
+                     f'any eq {1024 + i % 1000}')
+
+    # The last section of a config is only closed by the section after it
+    lines.append('mtu OUTSIDE 1500')
+
+    return '\n'.join(lines)
+
+
+def per_entry(config, entries, repeat):
+    """
+    Returns the median microseconds spent on each entry, over repeat loads
+    """
+    empty = build_config(0)
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ASA(from_config=config)
+        loaded = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ASA(from_config=empty)
+        overhead = time.perf_counter() - start
+
+        timings.append((loaded - overhead) / entries * 1e6)
+
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-entry construction cost of access-list entries')
+    parser.add_argument('--entries', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    config = build_config(args.entries)
+    cached = ModelField.model_class
+
+    # Loads once first, so both runs start with every module imported
+    ASA(from_config=config)
+
+    ModelField.model_class = property(resolve_uncached)
+    uncached_cost = per_entry(config, args.entries, args.repeat)
+
+    ModelField.model_class = cached
+    cached_cost = per_entry(config, args.entries, args.repeat)
+
+    print(f"{args.entries} entries, median of {args.repeat} loads")
+    print(f"  model class resolved per value: {uncached_cost:.2f} us per entry")
+    print(f"  model class cached:             {cached_cost:.2f} us per entry")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+"""
+Measures how long a fresh interpreter takes to import the ASA model, and how
+many configparity modules the import loads. Each run is a new process, so
+nothing is already imported.
+
+    python benchmarks/import_time.py --runs 21
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = '''
+import sys
+import time
+start = time.perf_counter()
+from configparity.models.cisco.asa import ASA
+seconds = time.perf_counter() - start
+loaded = [name for name in sys.modules if name.startswith('configparity')]
+print(seconds, len(loaded))
+'''
+
+
+def time_import():
+    """
+    Returns the seconds the import took and the number of configparity modules it loaded
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', SCRIPT],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True).stdout.split()
+
+    return float(output[0]), int(output[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time of the ASA model in a fresh interpreter')
+    parser.add_argument('--runs', type=int, default=21)
+    args = parser.parse_args()
+
+    results = [time_import() for _ in range(args.runs)]
+    seconds = statistics.median(result[0] for result in results)
+
+    print(f"from configparity.models.cisco.asa import ASA, median of {args.runs} runs")
+    print(f"  {seconds * 1000:.1f} ms, {results[0][1]} configparity modules loaded")
+
+
+if __name__ == '__main__':
+    main()
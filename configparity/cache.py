@@ -0,0 +1,192 @@
+from configparity import __version__
+import hashlib
+import os
+import pickle
+import tempfile
+
+"""
+The parse cache keeps parsed models on disk, keyed by a hash of the config
+they were parsed from, so a config that has not changed since the last run
+is loaded from its snapshot instead of being parsed again. Entries are
+pickles, so a cache directory should only ever be shared with trusted users.
+"""
+
+
+class ParseCache(object):
+    """
+    A directory of parsed model snapshots, evicted least recently used first
+    Entries are kept under a folder named for the version of the library's
+    model and field definitions, so changing any of them starts a new cache
+    """
+
+    SUFFIX = '.pickle'
+
+    _version = None
+
+    def __init__(self, directory, max_entries=1024, max_bytes=None):
+        self.directory = os.fspath(directory)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_option(cls, cache):
+        """
+        Returns a ParseCache for a cache option, which may already be a
+        ParseCache, a directory path, or None for no cache
+        """
+        if cache is None or isinstance(cache, ParseCache):
+            return cache
+
+        return cls(cache)
+
+    @classmethod
+    def version(cls):
+        """
+        A hash of the library version and the source of its models and fields
+        """
+        if cls._version is None:
+            digest = hashlib.sha256(__version__.encode())
+            package = os.path.dirname(os.path.abspath(__file__))
+
+            for folder in ['fields', 'models']:
+                for root, _, files in sorted(os.walk(os.path.join(package, folder))):
+                    for name in sorted(files):
+                        if not name.endswith('.py'):
+                            continue
+
+                        digest.update(name.encode())
+
+                        with open(os.path.join(root, name), 'rb') as source:
+                            digest.update(source.read())
+
+            ParseCache._version = digest.hexdigest()[:16]
+
+        return cls._version
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, self.version())
+
+    def key(self, model, config, options=None):
+        """
+        Hashes a config, given as text or any bytes-like object, for a model
+        class and the options that change how the model is loaded
+        """
+        if isinstance(config, str):
+            config = config.encode()
+
+        digest = hashlib.sha256(f'{model.__module__}.{model.__qualname__}\n{options!r}\n'.encode())
+        digest.update(config)
+
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key + self.SUFFIX)
+
+    def get(self, key):
+        """
+        Returns the model stored under key, or None when there is no usable entry
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, 'rb') as entry:
+                model = pickle.load(entry)
+
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+        # Reading an entry makes it the most recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return model
+
+    def put(self, key, model):
+        os.makedirs(self.path, exist_ok=True)
+
+        # Written to a temporary file first so readers never see half an entry
+        handle, temp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+
+        try:
+            with os.fdopen(handle, 'wb') as entry:
+                pickle.dump(model, entry, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, self._entry_path(key))
+
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+            raise
+
+        self.evict()
+
+    def entries(self):
+        """
+        Returns (last used, size, path) for each entry of the current version,
+        least recently used first
+        """
+        entries = []
+
+        if not os.path.isdir(self.path):
+            return entries
+
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(self.SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        return sorted(entries)
+
+    def evict(self):
+        """
+        Removes entries left by other versions, then the least recently used
+        entries until the cache is within max_entries and max_bytes
+        """
+        for folder in self._version_folders():
+            if folder.name != self.version():
+                self._remove_folder(folder.path)
+
+        entries = self.entries()
+        total_bytes = sum(size for _, size, _ in entries)
+
+        while entries and any([
+                self.max_entries is not None and len(entries) > self.max_entries,
+                self.max_bytes is not None and total_bytes > self.max_bytes]):
+            _, size, entry_path = entries.pop(0)
+            total_bytes -= size
+
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+    def clear(self):
+        for folder in self._version_folders():
+            self._remove_folder(folder.path)
+
+    def _version_folders(self):
+        # Only folders named like a version are touched, in case the cache
+        # directory is shared with other files
+        if not os.path.isdir(self.directory):
+            return []
+
+        return [
+            folder for folder in os.scandir(self.directory)
+            if folder.is_dir() and len(folder.name) == 16 and all(c in '0123456789abcdef' for c in folder.name)]
+
+    def _remove_folder(self, path):
+        for entry in os.scandir(path):
+            if entry.is_file() and (entry.name.endswith(self.SUFFIX) or entry.name.endswith('.tmp')):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
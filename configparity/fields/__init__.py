@@ -1,6 +1,5 @@
+from collections import namedtuple
 from importlib import import_module
-from pkgutil import iter_modules
-from os import path
 import sys
 
 """
@@ -14,12 +13,21 @@ class FieldValueException(BaseException):
     pass
 
 
+"""
+A value a field refused, with the reason it gave. line is the number of
+the config line the value was read from, when it came from a config.
+"""
+FieldError = namedtuple('FieldError', ['field', 'value', 'message', 'line'], defaults=(None,))
+
+
 class Field(object):
     is_field = True
+    is_relational = False
     is_type_dynamic = False
     force_str_in_dict = False
 
     def __init__(self, *args, **kwargs):
+        self.name = None
         self.description = self.__class__.__name__
         self.no_exceptions = False
 
@@ -27,7 +35,29 @@ class Field(object):
         self._high = kwargs.get('high')
         self._default = kwargs.get('default')
         self._readonly = kwargs.get('readonly') or False
-        self._hide_from_changes = kwargs.get('hide_from_changes') or True
+        self._hide_from_changes = kwargs.get('hide_from_changes') or False
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        name = self.name
+        values = instance.values
+
+        if name in values:
+            return values[name]
+
+        # Defaults are read from the table the model class built once
+        value = instance._field_defaults.get(name)
+        values[name] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        instance.set_field_value(self.name, value)
 
     @property
     def default(self):
@@ -41,6 +71,45 @@ class Field(object):
     def hide_from_changes(self):
         return self._hide_from_changes
 
+    def can_accept(self, value):
+        """
+        A cheap check of whether this field could take value, used to pass over
+        fields that cannot match before calling them. Only returns False when
+        calling the field with value would certainly raise a FieldValueException
+        """
+        return True
+
+    def check(self, value, current=None, from_model=None):
+        """
+        Converts value as calling the field would, but returns a refused value
+        instead of raising, as (ok, converted, error) where error is the reason
+        Values can_accept rules out are refused without calling the field
+        """
+        try:
+            accepted = self.no_exceptions or self.can_accept(value)
+
+        # A value can_accept cannot judge is left to the field itself
+        except Exception:
+            accepted = True
+
+        if not accepted:
+            return False, None, self.value_error(value)
+
+        try:
+            if self.is_relational:
+                converted = self(from_model=from_model, value=value, current=current)
+            else:
+                converted = self(value=value, current=current)
+
+        except (KeyboardInterrupt, SystemExit):
+            raise
+
+        # Models raise their own BaseExceptions, and malformed config can raise anything
+        except BaseException as exception:
+            return False, None, str(exception) or type(exception).__name__
+
+        return True, converted, None
+
     def should_force_str(self, value):
         return self.force_str_in_dict
 
@@ -50,11 +119,14 @@ class Field(object):
 
         return value
 
+    def value_error(self, value):
+        return f'"{value}" does not appear to be a valid {self.description} input'
+
     def field_value_exception(self, value):
         if self.no_exceptions:
             return None
 
-        error = f'"{value}" does not appear to be a valid {self.description} input'
+        error = self.value_error(value)
         raise FieldValueException(error).with_traceback(sys.exc_info()[2])
 
     def field_key_exception(self, key):
@@ -85,14 +157,18 @@ class Field(object):
         error = f'{self.description} field value "{value}" did not match the specified format "{str_format}"'
         raise FieldValueException(error).with_traceback(sys.exc_info()[2])
 
-    def field_range_exception(self, value):
-        if self.no_exceptions:
-            return None
-
+    def range_error(self, value):
         error = f'"{value}" is out of range for this {self.description} input'
         error += f' LOW: {self._low} ' if self._low else ''
         error += f' HIGH: {self._high} ' if self._high else ''
 
+        return error
+
+    def field_range_exception(self, value):
+        if self.no_exceptions:
+            return None
+
+        error = self.range_error(value)
         raise FieldValueException(error).with_traceback(sys.exc_info()[2])
 
     def field_iterable_exception(self):
@@ -125,18 +201,22 @@ class Field(object):
 
 
 """
-This fancy code automatically imports fields from the files
-in the fields folder upon initialization.
+Modules in the fields folder are imported on first access rather
+than upon initialization, so importing a single model only pulls in
+the modules it actually uses.
 """
-modules = []
-
-for (_, name, _) in iter_modules([path.dirname(__file__)]):
-    modules.append(name)
-    imported_module = import_module('.' + name, package='configparity.fields')
-    class_name = list(filter(lambda x: not x.startswith('__'), dir(imported_module)))
-
-del import_module
-del iter_modules
-del path
-del imported_module
-del class_name
+modules = [
+    'common',
+    'hardware',
+    'networking']
+
+
+def __getattr__(name):
+    if name in modules:
+        return import_module('.' + name, package=__name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(modules))
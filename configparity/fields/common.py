@@ -1,6 +1,10 @@
 from . import Field
 from . import FieldValueException
+from bisect import bisect_right
 from importlib import import_module
+from configparity.models import ConfigLines
+from configparity.models import MODEL_REGISTRY
+from configparity.models import source_digest
 from datetime import datetime
 
 
@@ -39,11 +43,43 @@ class StrField(Field):
 
         return value
 
+    def can_accept(self, value):
+        if not self._allowed or not value:
+            return True
+
+        return str(value) in self._allowed
+
 
 class IntField(Field):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def can_accept(self, value):
+        if isinstance(value, str):
+            # isdigit() also takes characters such as superscripts that int() refuses
+            if not value.isdecimal():
+                # int() also takes signs, whitespace and underscores
+                return value.strip().lstrip('+-').replace('_', '').isdecimal()
+
+            value = int(value)
+
+        elif not isinstance(value, int):
+            return True
+
+        if value:
+            if self._low and value < self._low or self._high and value > self._high:
+                return False
+
+        return True
+
+    def value_error(self, value):
+        try:
+            int(value)
+        except Exception:
+            return super().value_error(value)
+
+        return self.range_error(value)
+
     def __call__(self, value=None, current=None):
         try:
             value = int(value) if value else None
@@ -126,14 +162,402 @@ class BoolField(Field):
         return value
 
 
+class TrackedList(list):
+    """
+    The list a ListField stores on a model
+    It tells the model before the list is changed in place, and has only the
+    items being added converted by its ListField, never the ones it holds
+    """
+
+    model = None
+    field = None
+    list_field = None
+    from_model = None
+
+    def __init__(self, iterable=(), model=None, field=None):
+        super().__init__(iterable)
+
+        self.model = model
+        self.field = field
+
+    def bind(self, list_field, from_model=None):
+        self.list_field = list_field
+        self.from_model = from_model
+        self.model = from_model if getattr(from_model, 'is_model', False) else None
+        self.field = list_field.name
+
+    def stored_items(self):
+        """
+        Returns the items as the list holds them, without building or unpacking them
+        """
+        return list(list.__iter__(self))
+
+    def _convert(self, value):
+        if self.list_field is None:
+            return value
+
+        try:
+            return self.list_field.convert_item(value, from_model=self.from_model)
+
+        except Exception:
+            return self.list_field.field_value_exception(value)
+
+    def _convert_all(self, values):
+        return [self._convert(value) for value in values]
+
+    def _will_change(self):
+        if self.model is not None:
+            self.model.field_will_change(self.field)
+
+    def _check_index(self, index):
+        # Raises the IndexError the list would, before the model is told of a change
+        if not isinstance(index, slice):
+            list.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self._convert_all(value)
+        else:
+            value = self._convert(value)
+
+        self._check_index(index)
+        self._will_change()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._check_index(index)
+        self._will_change()
+        super().__delitem__(index)
+
+    def __iadd__(self, values):
+        values = self._convert_all(values)
+
+        self._will_change()
+        return super().__iadd__(values)
+
+    def __imul__(self, value):
+        self._will_change()
+        return super().__imul__(value)
+
+    def append(self, value):
+        value = self._convert(value)
+
+        self._will_change()
+        super().append(value)
+
+    def extend(self, values):
+        values = self._convert_all(values)
+
+        self._will_change()
+        super().extend(values)
+
+    def insert(self, index, value):
+        value = self._convert(value)
+
+        self._will_change()
+        super().insert(index, value)
+
+    def remove(self, value):
+        # The item is looked up first, so removing a value the list does not hold changes nothing
+        index = self.index(value)
+
+        self._will_change()
+        list.__delitem__(self, index)
+
+    def pop(self, index=-1):
+        self._check_index(index)
+        self._will_change()
+        return super().pop(index)
+
+    def clear(self):
+        self._will_change()
+        super().clear()
+
+    def reverse(self):
+        self._will_change()
+        super().reverse()
+
+    def sort(self, *args, **kwargs):
+        self._will_change()
+        super().sort(*args, **kwargs)
+
+
+class Unbuilt(object):
+    """
+    Holds the raw value of a LazyList item that has not been built yet,
+    and the item once it is, so lists sharing the placeholder share the item
+    """
+
+    __slots__ = ('raw', 'built')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.built = None
+
+    @staticmethod
+    def resolve(item):
+        if type(item) is Unbuilt and item.built is not None:
+            return item.built
+
+        return item
+
+
+class LazyList(TrackedList):
+    """
+    A TrackedList that keeps each item as the raw config it was read from,
+    and only builds it through its ListField the first time it is read
+    """
+
+    def __init__(self, iterable=(), model=None, field=None):
+        super().__init__((Unbuilt(item) for item in iterable), model=model, field=field)
+
+    def _build(self, index):
+        item = list.__getitem__(self, index)
+
+        if type(item) is not Unbuilt:
+            return item
+
+        if item.built is not None:
+            built = item.built
+
+        elif self.list_field is None:
+            return item.raw
+
+        else:
+            try:
+                built = self.list_field.convert_item(item.raw, from_model=self.from_model)
+
+            except Exception:
+                built = self.list_field.field_value_exception(item.raw)
+
+            # A model built from its text remembers it, as a model loaded eagerly does
+            if getattr(built, 'is_model', False):
+                built._source = source_digest(item.raw)
+
+            item.built = built
+
+        list.__setitem__(self, index, built)
+
+        return built
+
+    def _build_all(self):
+        for index in range(len(self)):
+            self._build(index)
+
+    def snapshot(self):
+        """
+        Returns a copy that shares the placeholders of the items not read yet,
+        so copying does not build them and either list builds them only once
+        """
+        snapshot = LazyList()
+        list.extend(snapshot, list.__iter__(self))
+        snapshot.list_field = self.list_field
+        snapshot.from_model = self.from_model
+
+        return snapshot
+
+    def is_built(self, index):
+        return type(list.__getitem__(self, index)) is not Unbuilt
+
+    def iter_raw(self):
+        """
+        Yields each item without building it: the built item when it has
+        been read, otherwise the raw config it will be built from
+        """
+        for item in list.__iter__(self):
+            yield item.raw if type(item) is Unbuilt else item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self)))]
+
+        return self._build(index)
+
+    def __iter__(self):
+        index = 0
+
+        while index < len(self):
+            yield self._build(index)
+            index += 1
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self._build(index)
+
+    def __contains__(self, value):
+        self._build_all()
+        return super().__contains__(value)
+
+    def __eq__(self, other):
+        self._build_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, count):
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        # Items that were never read are pickled as their placeholders,
+        # so a snapshot of the list still shares them once unpickled
+        return (LazyList.from_items, (list(list.__iter__(self)),), self.__dict__)
+
+    @classmethod
+    def from_items(cls, items):
+        lazy = cls()
+        list.extend(lazy, items)
+
+        return lazy
+
+    def copy(self):
+        return list(self)
+
+    def index(self, value, *args):
+        self._build_all()
+        return super().index(value, *args)
+
+    def count(self, value):
+        self._build_all()
+        return super().count(value)
+
+    def remove(self, value):
+        self._build_all()
+        super().remove(value)
+
+    def pop(self, index=-1):
+        self._build(index)
+        return super().pop(index)
+
+    def sort(self, *args, **kwargs):
+        self._build_all()
+        super().sort(*args, **kwargs)
+
+
+def iter_raw(values):
+    """
+    Iterates a list field's value without building the items of a LazyList
+    """
+    if isinstance(values, LazyList):
+        return values.iter_raw()
+
+    return iter(values or [])
+
+
+def iter_items(values):
+    """
+    Iterates a list field's value without building the items of a LazyList,
+    yielding the placeholder of an item not read yet, so two lists can be
+    compared item by item by identity
+    """
+    if isinstance(values, LazyList):
+        return map(Unbuilt.resolve, list.__iter__(values))
+
+    return iter(values or [])
+
+
 class ListField(Field):
-    def __init__(self, list_type=None, *args, **kwargs):
+    def __init__(self, list_type=None, *args, list_class=None, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._list_type = list_type
+        self._list_class = list_class or TrackedList
         self.is_relational = True
         self.is_type_dynamic = self._list_type.is_type_dynamic
 
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+
+        if self._list_type:
+            self._list_type.name = name
+
+    @property
+    def list_type(self):
+        return self._list_type
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        values = instance.values
+
+        if self.name in values:
+            return values[self.name]
+
+        default = instance._field_defaults.get(self.name)
+
+        # A list default is copied into a list of the model's own, so what is
+        # added to it is converted and tracked, and the default is left alone
+        if isinstance(default, (list, tuple)):
+            default = self(value=list(default), from_model=instance)
+
+        values[self.name] = default
+
+        return default
+
+    def can_accept(self, value):
+        # Items of a LazyList are raw config until they are read
+        if not self._list_type or not isinstance(value, (list, tuple)) or isinstance(value, LazyList):
+            return True
+
+        list_type = self._list_type
+
+        return list_type.no_exceptions or all(list_type.can_accept(item) for item in value)
+
+    def convert_item(self, item, from_model=None, current=None):
+        if not self._list_type:
+            return item
+
+        if self._list_type.is_relational:
+            return self._list_type(
+                from_model=from_model if from_model else self,
+                value=item,
+                current=current)
+
+        return self._list_type(value=item, current=current)
+
+    def convert_items(self, values, from_model=None, current=None):
+        """
+        Converts the items of a new value, keeping the items already converted
+        into the current list as they are, so adding to a long list converts
+        only what was added
+        """
+        converted = ()
+
+        # The stored items are held until the conversion is done, so no new item can take their ids
+        if isinstance(current, TrackedList) and current.list_field is self:
+            stored = current.stored_items()
+            converted = set(map(id, stored))
+
+        items = []
+
+        for i, item in enumerate(values):
+            if id(item) in converted:
+                items.append(item)
+                continue
+
+            try:
+                current_item = current[i] if current and i < len(current) else None
+                items.append(self.convert_item(item, from_model=from_model, current=current_item))
+
+            except Exception:
+                self.field_value_exception(item)
+
+        return items
+
     def stringify_value(self, values):
         if not self.is_type_dynamic:
             return values
@@ -146,38 +570,16 @@ class ListField(Field):
 
         values = value
 
-        if values:
-            try:
-                new = []
-                i = 0
-
-                for item in value:
-                    try:
-                        current_item = None
-
-                        if current and len(current) - 1 >= i:
-                            current_item = current[i]
-
-                        if self._list_type:
-                            if 'is_relational' in dir(self._list_type) and self._list_type.is_relational:
-                                from_model = self if not from_model else from_model
-
-                                item = self._list_type(
-                                    from_model=from_model,
-                                    value=item,
-                                    current=current_item)
-                            else:
-                                item = self._list_type(
-                                    value=item,
-                                    current=current_item)
-
-                        new.append(item)
-                        i += 1
-
-                    except Exception:
-                        self.field_value_exception(item)
+        # Items of a LazyList are built when they are first read
+        if isinstance(values, LazyList):
+            values.bind(self, from_model)
+            return values
 
-                values = new
+        # Empty lists are stored as a bound list too, so changes to them are tracked
+        if values or isinstance(values, (list, tuple)):
+            try:
+                values = self._list_class(self.convert_items(value, from_model=from_model, current=current))
+                values.bind(self, from_model)
 
             except Exception:
                 self.field_value_exception(values)
@@ -217,7 +619,7 @@ class TupleField(Field):
                         current_item = current[i]
 
                     if self._tuple_type:
-                        if 'is_relational' in dir(self._tuple_type) and self._tuple_type.is_relational:
+                        if self._tuple_type.is_relational:
                             from_model = self if not from_model else from_model
 
                             item = self._tuple_type(
@@ -244,18 +646,16 @@ class DictField(Field):
     def __init__(self, default=None, readonly=False, allowed=None):
         super().__init__()
 
-        for pair in allowed or []:
-            try:
-                pair = tuple(pair)
-            except Exception:
-                self.field_allowed_type_exception(pair)
-
-            if not pair[1] or not hasattr(pair[1], 'description'):
-                self.field_allowed_type_exception(pair[1])
-
         self._default = default
         self._readonly = readonly
         self._allowed = allowed
+        self._field_types = None
+        self._allowed_keys = None
+
+        # allowed may be a function returning the pairs, for validators that
+        # are costly to build, which is then called the first time it is needed
+        if not callable(allowed):
+            self._index_allowed()
 
     @property
     def default(self):
@@ -265,40 +665,74 @@ class DictField(Field):
     def readonly(self):
         return self._readonly
 
-    def _get_field_type(self, key):
+    def _index_allowed(self):
+        if callable(self._allowed):
+            self._allowed = self._allowed()
+
+        # The field for each allowed key, where the first pair for a key wins
+        field_types = {}
+
         for pair in self._allowed or []:
-            if pair[0] == key:
-                return pair[1]
+            try:
+                pair = tuple(pair)
+            except Exception:
+                self.field_allowed_type_exception(pair)
 
-        return None
+            if not pair[1] or not hasattr(pair[1], 'description'):
+                self.field_allowed_type_exception(pair[1])
 
-    def __call__(self, value=None, current=None):
-        if current and value != current and self._readonly:
-            self.field_readonly_exception()
+            field_types.setdefault(pair[0], pair[1])
 
-        if value:
-            try:
-                if current:
-                    input_dict = dict(value)
-                    value = current
+        self._allowed_keys = frozenset(field_types)
+        self._field_types = field_types
+
+        return field_types
+
+    def _get_field_type(self, key):
+        field_types = self._field_types
+
+        if field_types is None:
+            field_types = self._index_allowed()
+
+        return field_types.get(key)
 
-                    allowed_keys = None
+    def update(self, current, values):
+        """
+        Checks and converts every key of values before setting any of them,
+        then sets them on current all at once, so a refused key or value
+        leaves current as it was
+        """
+        values = dict(values)
+        field_types = self._field_types
 
-                    if self._allowed:
-                        allowed_keys = [pair[0] for pair in self._allowed]
+        if field_types is None:
+            field_types = self._index_allowed()
 
-                    for key, new_value in input_dict.items():
-                        if self._allowed and key not in allowed_keys:
-                            self.field_key_exception(key)
+        if self._allowed and not self._allowed_keys.issuperset(values):
+            for key in values:
+                if key not in self._allowed_keys:
+                    self.field_key_exception(key)
 
-                        field_type = self._get_field_type(key)
+        for key, new_value in values.items():
+            field_type = field_types.get(key)
 
-                        if field_type:
-                            new_value = field_type(
-                                value=new_value,
-                                current=current)
+            if field_type:
+                values[key] = field_type(
+                    value=new_value,
+                    current=current)
 
-                        value[key] = new_value
+        current.update(values)
+
+        return current
+
+    def __call__(self, value=None, current=None):
+        if current and value != current and self._readonly:
+            self.field_readonly_exception()
+
+        if value:
+            try:
+                if current:
+                    value = self.update(current, value)
                 else:
                     value = dict(value)
 
@@ -417,6 +851,19 @@ class EmailField(StrField):
         return value
 
 
+def is_plain_int_field(field_type):
+    """
+    Whether a field validates exactly as IntField does, so its range can be
+    folded into an AllowedField range table
+    """
+    return all([
+        isinstance(field_type, IntField),
+        type(field_type).__call__ is IntField.__call__,
+        type(field_type).can_accept is IntField.can_accept,
+        not field_type.readonly,
+        not field_type.no_exceptions])
+
+
 class AllowedField(Field):
     is_type_dynamic = True
 
@@ -436,10 +883,82 @@ class AllowedField(Field):
         self.field_types = tuple(field_types)
         self.is_relational = True
 
+        self._force_str_types = tuple(
+            field_type for field_type in self.field_types if field_type.force_str_in_dict)
+
+        self._range_lows, self._range_highs, self._other_types = self._compile_ranges()
+
+    def _compile_ranges(self):
+        """
+        Folds the leading IntFields into a sorted table of merged ranges, so
+        a number is checked against all of them with a single bisect. Returns
+        the range lows and highs, and the fields still to be tried in order
+        """
+        ranges = []
+
+        for position, field_type in enumerate(self.field_types):
+            if not is_plain_int_field(field_type):
+                break
+
+            ranges.append((
+                field_type._low or float('-inf'),
+                field_type._high or float('inf')))
+        else:
+            position = len(self.field_types)
+
+        if not ranges:
+            return None, None, self.field_types
+
+        lows = []
+        highs = []
+
+        for low, high in sorted(ranges):
+            if highs and low <= highs[-1] + 1:
+                highs[-1] = max(highs[-1], high)
+            else:
+                lows.append(low)
+                highs.append(high)
+
+        return lows, highs, self.field_types[position:]
+
+    def _match_range(self, value):
+        # Mirrors IntField, which takes anything int() does and lets 0 through
+        try:
+            number = int(value)
+        except Exception:
+            return None
+
+        if not number:
+            return number
+
+        index = bisect_right(self._range_lows, number) - 1
+
+        if index >= 0 and number <= self._range_highs[index]:
+            return number
+
+        return None
+
+    def can_accept(self, value):
+        if not value:
+            return True
+
+        if self._range_lows and self._match_range(value) is not None:
+            return True
+
+        return any(True for _ in self._candidates(value, self._other_types))
+
+    def _candidates(self, value, field_types=None):
+        # Fields that cannot take value are passed over without being called,
+        # so most values never raise a FieldValueException on the way
+        if field_types is None:
+            field_types = self.field_types
+
+        for field_type in field_types:
+            if field_type.no_exceptions or field_type.can_accept(value):
+                yield field_type
+
     def should_force_str(self, value):
-        for field_type in self.field_types:
-            if not field_type.force_str_in_dict:
-                continue
+        for field_type in self._candidates(value, self._force_str_types):
 
             try:
                 if field_type == ModelField:
@@ -471,8 +990,15 @@ class AllowedField(Field):
 
         found = None
         good = False
+        field_types = self._other_types
+
+        if self._range_lows:
+            found = self._match_range(value)
 
-        for field_type in self.field_types:
+            if found is not None:
+                return found
+
+        for field_type in self._candidates(value, field_types):
             try:
                 if field_type == ModelField:
                     found = field_type(
@@ -498,6 +1024,14 @@ class AllowedField(Field):
 
 class ModelField(Field):
     def _validate_model(self, model_input):
+        if isinstance(model_input, type):
+            return model_input
+
+        model = MODEL_REGISTRY.get(model_input)
+
+        if model:
+            return model
+
         try:
             model_path = 'configparity.models.' + '.'.join(model_input.split('.')[:-2])
             model_file = model_input.split('.')[-2]
@@ -516,11 +1050,19 @@ class ModelField(Field):
         self.related_name = related_name
         self.is_relational = True
         self._readonly = readonly
+        self._model_class = None
 
     @property
     def readonly(self):
         return self._readonly
 
+    @property
+    def model_class(self):
+        if self._model_class is None:
+            self._model_class = self._validate_model(self.model)
+
+        return self._model_class
+
     def __call__(self, from_model, value=None, current=None):
         if not value:
             return None
@@ -528,18 +1070,23 @@ class ModelField(Field):
         if current and value != current and self._readonly:
             self.field_readonly_exception()
 
-        model = self._validate_model(self.model)
+        model = self.model_class
 
         if isinstance(value, dict):
             value = model(**value)
-        elif isinstance(value, str):
-            value = model(from_config=value)
+        elif isinstance(value, str) or isinstance(value, ConfigLines):
+            # Models loaded from config for a lazy model are lazy too
+            value = model(from_config=value, lazy=getattr(from_model, 'lazy', False))
 
         if not isinstance(value, model):
             self.field_value_exception(value)
 
+        # The back-reference is read from the child's values, as models have no __dict__
         if self.related_name:
-            setattr(value, self.related_name, type(self))
             value.values[self.related_name] = from_model
 
+            if getattr(from_model, 'is_model', False):
+                value._parent = from_model
+                value._parent_field = self.name
+
         return value
@@ -17,6 +17,10 @@ class BytesField(IntField):
     def readonly(self):
         return self._readonly
 
+    def can_accept(self, value):
+        # Sizes may carry a unit suffix, which IntField would refuse
+        return True
+
     def __call__(self, value=None, current=None):
         suffixes = [
             ('TB', 4),
@@ -1,6 +1,276 @@
-import ipaddress
 from .common import IntField
 from .common import StrField
+from .common import TrackedList
+from array import array
+from functools import lru_cache
+import ipaddress
+
+"""
+The same addresses and networks turn up thousands of times across a rule
+base, so parsed values are interned in bounded LRU caches. Identical input
+is mapped to one shared ipaddress object, which is immutable, instead of
+being parsed into a new object every time. IP_CACHE_SIZE bounds each cache,
+and ip_cache_info reports how well they are doing.
+"""
+
+IP_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=IP_CACHE_SIZE, typed=True)
+def parse_ip_address(value):
+    return ipaddress.ip_address(value)
+
+
+@lru_cache(maxsize=IP_CACHE_SIZE, typed=True)
+def parse_ip_network(value, strict=True):
+    return ipaddress.ip_network(value, strict=strict)
+
+
+def ip_cache_info():
+    """
+    Returns the hits, misses, maxsize and currsize of the address and network caches
+    """
+    return {
+        'address': parse_ip_address.cache_info()._asdict(),
+        'network': parse_ip_network.cache_info()._asdict()}
+
+
+def clear_ip_cache():
+    parse_ip_address.cache_clear()
+    parse_ip_network.cache_clear()
+
+
+def is_ip_text(value):
+    """
+    Whether a string could be an IPv4 or IPv6 address, judged by its first
+    character and separators, so names such as any or host are ruled out
+    """
+    return value[0] in '0123456789abcdefABCDEF:' and ('.' in value or ':' in value)
+
+
+class Packed(object):
+    """
+    Holds the place of an item a CompactIPList keeps in its arrays
+    """
+
+    def __repr__(self):
+        return 'PACKED'
+
+    def __reduce__(self):
+        return 'PACKED'
+
+
+PACKED = Packed()
+
+
+class CompactIPList(TrackedList):
+    """
+    A TrackedList that keeps IPv4 addresses and networks as an unsigned int
+    and a prefix length in two arrays, which take a fraction of the memory of
+    ipaddress objects, and builds new ipaddress objects from them as they are
+    read. Anything else, such as names or IPv6 values, is stored as it is
+    """
+
+    def __init__(self, iterable=(), model=None, field=None):
+        super().__init__(model=model, field=field)
+
+        self._addresses = array('I')
+        self._prefixes = array('b')
+        self._append_packed(iterable)
+
+    @staticmethod
+    def _pack(value):
+        # Returns the list slot, address and prefix length for value, where
+        # a prefix length of -1 marks an address and -2 an item kept as it is
+        value_type = type(value)
+
+        if value_type is ipaddress.IPv4Address:
+            return PACKED, int(value), -1
+
+        if value_type is ipaddress.IPv4Network:
+            return PACKED, int(value.network_address), value.prefixlen
+
+        return value, 0, -2
+
+    def _unpack(self, index, item):
+        # Read through the interning caches, so reading an item twice gives the same object
+        if item is not PACKED:
+            return item
+
+        address = self._addresses[index]
+        prefix = self._prefixes[index]
+
+        if prefix < 0:
+            return parse_ip_address(address)
+
+        return parse_ip_network((address, prefix))
+
+    def _pack_all(self, values):
+        packed = [self._pack(value) for value in values]
+
+        return (
+            [item for item, _, _ in packed],
+            array('I', [address for _, address, _ in packed]),
+            array('b', [prefix for _, _, prefix in packed]))
+
+    def _append_packed(self, values):
+        items, addresses, prefixes = self._pack_all(values)
+
+        list.extend(self, items)
+        self._addresses.extend(addresses)
+        self._prefixes.extend(prefixes)
+
+    def _replace_all(self, values):
+        items, self._addresses, self._prefixes = self._pack_all(values)
+        list.__setitem__(self, slice(None), items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = list.__getitem__(self, index)
+
+        return self._unpack(index, item)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            items, addresses, prefixes = self._pack_all(self._convert_all(value))
+        else:
+            items, addresses, prefixes = self._pack(self._convert(value))
+
+        self._check_index(index)
+        self._will_change()
+        list.__setitem__(self, index, items)
+        self._addresses[index] = addresses
+        self._prefixes[index] = prefixes
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        del self._addresses[index]
+        del self._prefixes[index]
+
+    def __iter__(self):
+        for index, item in enumerate(list.__iter__(self)):
+            yield self._unpack(index, item)
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self[index]
+
+    def __contains__(self, value):
+        return any(item == value for item in self)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactIPList):
+            other = list(other)
+
+        return list(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __mul__(self, count):
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._addresses *= count
+        self._prefixes *= count
+
+        return self
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def stored_items(self):
+        # Packed items are only ever handed out unpacked
+        return list(self)
+
+    def __sizeof__(self):
+        return super().__sizeof__() + self._addresses.__sizeof__() + self._prefixes.__sizeof__()
+
+    def __reduce__(self):
+        # Pickled packed, with the list slots alongside the arrays
+        return (CompactIPList, (), dict(self.__dict__, items=list(list.__iter__(self))))
+
+    def __setstate__(self, state):
+        state = dict(state)
+
+        list.extend(self, state.pop('items'))
+        state['_addresses'] = array('I', state['_addresses'])
+        state['_prefixes'] = array('b', state['_prefixes'])
+
+        self.__dict__.update(state)
+
+    def copy(self):
+        return list(self)
+
+    def append(self, value):
+        value = self._convert(value)
+
+        self._will_change()
+        self._append_packed([value])
+
+    def extend(self, values):
+        values = self._convert_all(values)
+
+        self._will_change()
+        self._append_packed(values)
+
+    def insert(self, index, value):
+        item, address, prefix = self._pack(self._convert(value))
+
+        self._will_change()
+        list.insert(self, index, item)
+        self._addresses.insert(index, address)
+        self._prefixes.insert(index, prefix)
+
+    def index(self, value, *args):
+        return list(self).index(value, *args)
+
+    def count(self, value):
+        return sum(1 for item in self if item == value)
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def pop(self, index=-1):
+        value = self[index]
+        del self[index]
+
+        return value
+
+    def clear(self):
+        super().clear()
+        del self._addresses[:]
+        del self._prefixes[:]
+
+    def reverse(self):
+        super().reverse()
+        self._addresses.reverse()
+        self._prefixes.reverse()
+
+    def sort(self, *args, **kwargs):
+        self._will_change()
+
+        items = list(self)
+        items.sort(*args, **kwargs)
+
+        self._replace_all(items)
 
 
 class IPAddressField(StrField):
@@ -26,13 +296,19 @@ class IPAddressField(StrField):
 
         if value:
             try:
-                value = ipaddress.ip_address(value)
+                value = parse_ip_address(value)
 
             except Exception:
                 self.field_value_exception(value)
 
         return value
 
+    def can_accept(self, value):
+        if not value or not isinstance(value, str):
+            return True
+
+        return is_ip_text(value) and ' ' not in value and '/' not in value
+
 
 class IPNetworkField(StrField):
     force_str_in_dict = True
@@ -59,13 +335,19 @@ class IPNetworkField(StrField):
         if value:
             try:
                 value = str(value).replace(" ", "/")
-                value = ipaddress.ip_network(value, strict=self._strict)
+                value = parse_ip_network(value, self._strict)
 
             except Exception:
                 self.field_value_exception(value)
 
         return value
 
+    def can_accept(self, value):
+        if not value or not isinstance(value, str):
+            return True
+
+        return is_ip_text(value) and value.count(' ') + value.count('/') <= 1
+
 
 class MACAddressField(StrField):
     def __init__(self, default=None, splitter=None, split_at=None, readonly=False):
@@ -118,6 +400,12 @@ class MACAddressField(StrField):
 
         return value
 
+    def can_accept(self, value):
+        if not value or not isinstance(value, str):
+            return True
+
+        return len([c for c in value.lower() if c in "0123456789abcdef"]) == 12
+
 
 class VLANField(IntField):
     def __init__(self, *args, **kwargs):
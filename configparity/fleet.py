@@ -0,0 +1,160 @@
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from configparity.fields import FieldValueException
+from configparity.models import ModelConfigException
+import os
+import time
+
+"""
+The fleet engine parses the configs of many devices across a process pool.
+Each device is parsed in a worker and sent back as a FleetResult holding a
+plain dictionary snapshot of the model, so the parent never receives the
+live object graph of a device.
+"""
+
+"""
+The outcome of parsing one device config. snapshot is the model's
+dictionary, or None when parsing failed, in which case error holds
+the reason.
+"""
+FleetResult = namedtuple('FleetResult', ['source', 'hostname', 'seconds', 'snapshot', 'error'])
+
+
+def _default_model():
+    from configparity.models.cisco.asa import ASA
+
+    return ASA
+
+
+def read_sources(sources):
+    """
+    Yields a (name, path, config) triple for every file in a directory, or
+    for each item of an iterable of file paths and (name, config string) pairs
+    """
+    if isinstance(sources, (str, os.PathLike)) and os.path.isdir(sources):
+        for entry in sorted(os.scandir(sources), key=lambda entry: entry.name):
+            if entry.is_file():
+                yield entry.name, entry.path, None
+
+        return
+
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+
+    for source in sources:
+        if isinstance(source, tuple):
+            yield source[0], None, source[1]
+        else:
+            yield os.fspath(source), source, None
+
+
+def parse_device(name, path=None, config=None, model=None, cache=None):
+    """
+    Parses one device config, from a file path or a config string, into a FleetResult
+    """
+    model = model or _default_model()
+    options = {'cache': cache} if cache else {}
+    start = time.perf_counter()
+
+    try:
+        if path is not None:
+            device = model.from_file(path, **options)
+        else:
+            device = model(from_config=config, **options)
+
+        snapshot = device.dictionary
+        hostname = snapshot.get('hostname')
+        error = None
+
+    except (Exception, FieldValueException, ModelConfigException) as exception:
+        snapshot = None
+        hostname = None
+        error = f'{type(exception).__name__}: {exception}'
+
+    return FleetResult(name, hostname, time.perf_counter() - start, snapshot, error)
+
+
+def parse_fleet(sources, workers=None, model=None, progress=None, max_pending=None, cache=None):
+    """
+    Parses every config in sources across a process pool, yielding a
+    FleetResult for each device as soon as it is done
+
+    Only max_pending devices (twice the number of workers by default) are
+    handed to the pool at a time, so memory stays flat however many
+    devices there are. progress is called with (done, total, result) after
+    each device, where total is None when sources is an iterator. With a
+    cache, such as a ParseCache or its directory, devices whose config has
+    not changed since it was cached are loaded from their snapshot.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    total = None
+
+    if isinstance(sources, (str, os.PathLike)) and os.path.isdir(sources):
+        sources = list(read_sources(sources))
+        total = len(sources)
+    else:
+        if hasattr(sources, '__len__') and not isinstance(sources, (str, os.PathLike)):
+            total = len(sources)
+
+        sources = read_sources(sources)
+
+    sources = iter(sources)
+    exhausted = False
+    pending = set()
+    done = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                source = next(sources, None)
+
+                if source is None:
+                    exhausted = True
+                    break
+
+                pending.add(executor.submit(parse_device, *source, model=model, cache=cache))
+
+            if not pending:
+                break
+
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                done += 1
+                result = future.result()
+
+                if progress:
+                    progress(done, total, result)
+
+                yield result
+
+
+def fleet_report(results):
+    """
+    Summarizes FleetResults into device counts, timings and failures
+    """
+    report = {
+        'devices': 0,
+        'parsed': 0,
+        'failed': 0,
+        'seconds': 0.0,
+        'slowest': None,
+        'failures': {}}
+
+    for result in results:
+        report['devices'] += 1
+        report['seconds'] += result.seconds
+
+        if result.error:
+            report['failed'] += 1
+            report['failures'][result.source] = result.error
+        else:
+            report['parsed'] += 1
+
+        if report['slowest'] is None or result.seconds > report['slowest'][1]:
+            report['slowest'] = (result.source, result.seconds)
+
+    return report
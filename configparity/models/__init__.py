@@ -1,8 +1,10 @@
 from collections.abc import Iterable
+from collections.abc import Mapping
+from collections import namedtuple
+from collections.abc import Sequence
+from configparity.fields import FieldError
 from importlib import import_module
-from pkgutil import iter_modules
-from os import path
-import copy
+from types import MappingProxyType
 import json
 import sys
 
@@ -11,23 +13,382 @@ class ModelConfigException(BaseException):
     pass
 
 
+"""
+Every Model subclass is registered here by its path relative to
+configparity.models, such as 'cisco.asa.access_list.AccessList',
+which is the path ModelField uses to refer to a related model.
+"""
+MODEL_REGISTRY = {}
+
+
+"""
+A config line split into its words, along with how deeply it is indented
+and its line number in the config it was read from. Words are interned, so
+the keywords repeated across thousands of lines are stored only once.
+"""
+ConfigToken = namedtuple('ConfigToken', ['words', 'depth', 'number'])
+
+
+def tokenize(line, number=0):
+    """
+    Splits a config line into a ConfigToken
+    """
+    words = tuple(map(sys.intern, filter(None, line.split(' '))))
+    depth = len(line) - len(line.lstrip(' '))
+
+    return ConfigToken(words, depth, number)
+
+
+class ConfigLines(Sequence):
+    """
+    A read-only view of one or more ranges of lines in a list of config
+    lines, so sections can be handed to models without copying or joining
+    their text
+    """
+
+    __slots__ = ('_lines', '_spans', '_tokens', '_length')
+
+    def __init__(self, lines, spans=None, tokens=None):
+        self._lines = lines
+        self._spans = spans if spans is not None else [(0, len(lines))]
+        self._tokens = tokens
+        self._length = sum(stop - start for start, stop in self._spans)
+
+    @classmethod
+    def join(cls, views):
+        views = list(views)
+        lines = None
+        tokens = None
+        spans = []
+
+        for view in views:
+            if lines is None:
+                lines = view._lines
+                tokens = view._tokens
+            elif view._lines is not lines:
+                return cls._concat(views)
+
+            for start, stop in view._spans:
+                if spans and spans[-1][1] == start:
+                    spans[-1] = (spans[-1][0], stop)
+                else:
+                    spans.append((start, stop))
+
+        return cls(lines if lines is not None else [], spans, tokens)
+
+    @classmethod
+    def _concat(cls, views):
+        # Views of different lists are copied into one, with their tokens when they all have them
+        lines = [line for view in views for line in view]
+
+        if any(view._tokens is None for view in views):
+            return cls(lines)
+
+        return cls(lines, tokens=[token for view in views for token in view.tokens])
+
+    @property
+    def tokens(self):
+        """
+        The ConfigToken for each line in the view, tokenizing the lines
+        here only if they were not tokenized when the view was made
+        """
+        if self._tokens is None:
+            return [tokenize(line, number) for number, line in enumerate(self)]
+
+        return self._gather(self._tokens)
+
+    def _gather(self, items):
+        if len(self._spans) == 1:
+            start, stop = self._spans[0]
+            return items[start:stop]
+
+        gathered = []
+
+        for start, stop in self._spans:
+            gathered.extend(items[start:stop])
+
+        return gathered
+
+    def without_tokens(self):
+        """
+        Returns a view of the same lines that does not hold on to their tokens,
+        for a view that is kept until it is read and tokenizes its lines then
+        """
+        return ConfigLines(self._lines, self._spans)
+
+    def views(self):
+        """
+        Yields a single line view for each line in the view
+        """
+        for start, stop in self._spans:
+            for index in range(start, stop):
+                yield ConfigLines(self._lines, [(index, index + 1)], self._tokens)
+
+    def __reduce__(self):
+        # Tokens are left out, and made again from the lines if they are needed
+        return (ConfigLines, (self._lines, self._spans))
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(self._gather(self._lines))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        if index < 0:
+            index += self._length
+
+        if index < 0 or index >= self._length:
+            raise IndexError('config line index out of range')
+
+        for start, stop in self._spans:
+            if index < stop - start:
+                return self._lines[start + index]
+
+            index -= stop - start
+
+    def __str__(self):
+        return '\n'.join(self._gather(self._lines))
+
+    def __repr__(self):
+        return f"ConfigLines('{len(self)} Lines')"
+
+
+def read_lines(config):
+    """
+    Returns the lines of a config string or a ConfigLines view
+    """
+    if isinstance(config, str):
+        return config.splitlines()
+
+    return list(config)
+
+
+def read_tokens(config):
+    """
+    Returns the ConfigToken for each line of a config string or a ConfigLines view
+    """
+    if isinstance(config, ConfigLines):
+        return config.tokens
+
+    return [tokenize(line, number) for number, line in enumerate(read_lines(config))]
+
+
+def first_words(config):
+    """
+    Returns the words of the first line of a config string or a ConfigLines
+    view that has any, or [''] when no line has
+    """
+    for token in read_tokens(config):
+        if token.words:
+            return list(token.words)
+
+    return ['']
+
+
+def read_text(config):
+    """
+    Returns the text of a config string or a ConfigLines view
+    """
+    if isinstance(config, str):
+        return config
+
+    return str(config)
+
+
+def source_hash():
+    """
+    Returns a new hash for source digests, so the digest of a config read in
+    parts can be made by adding the parts to it one at a time
+    """
+    # hashlib is only imported once a digest is needed
+    from hashlib import blake2b
+
+    return blake2b(digest_size=16)
+
+
+def source_digest(config):
+    """
+    Returns a digest of the text of a config string or a ConfigLines view,
+    which a model can keep instead of the text to tell whether it changed
+    """
+    digest = source_hash()
+    digest.update(read_text(config).encode())
+
+    return digest.digest()
+
+
+class InitialValues(Mapping):
+    """
+    A copy-on-write view of the values a model was loaded with
+    Values are shared with the model until a field is changed, at which point
+    the value the field was loaded with is kept aside for that field only
+    """
+
+    __slots__ = ('_values', '_keys', '_originals')
+
+    # Models of a class are mostly loaded with the same fields, so the
+    # ordered sets of keys are shared between them
+    _shared_keys = {}
+
+    def __init__(self, values):
+        keys = tuple(values)
+
+        self._values = values
+        self._keys = self._shared_keys.setdefault(keys, dict.fromkeys(keys))
+        self._originals = None
+
+        # Plain dicts can be changed in place without the model knowing about it
+        for key, value in values.items():
+            if type(value) is dict:
+                self._keep_original(key, self._copy_plain(value))
+
+    def _keep_original(self, key, value):
+        if self._originals is None:
+            self._originals = {}
+
+        self._originals[key] = value
+
+    @classmethod
+    def _copy_plain(cls, value):
+        if type(value) is dict:
+            return {key: cls._copy_plain(item) for key, item in value.items()}
+
+        if type(value) is list:
+            return [cls._copy_plain(item) for item in value]
+
+        return value
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+
+        if self._originals and key in self._originals:
+            return self._originals[key]
+
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def get(self, key, default=None):
+        if key not in self._keys:
+            return default
+
+        return self[key]
+
+    def preserve(self, key):
+        if key not in self._keys or self._originals and key in self._originals:
+            return
+
+        value = self._values[key]
+
+        # A lazy list copies itself without building the items not read yet
+        if hasattr(value, 'snapshot'):
+            value = value.snapshot()
+
+        elif isinstance(value, list):
+            value = list(value)
+
+        self._keep_original(key, value)
+
+
+"""
+Shared by every model that has not changed, until its first change
+"""
+NO_CHANGES = MappingProxyType({})
+
+
 class Model(object):
     """
     This is the base model where common functions for a model can exist
-    It also does the work to override values that have a predetermined field type
     Field Types are set at the top of a model importing this base Model class
+    They are descriptors that read and validate values stored in self.values
     """
 
+    # A config can hold millions of small models, so the state every model
+    # has is kept in slots, and what can be worked out from the class is not
+    # kept per model at all
+    __slots__ = (
+        'values',
+        'initial_values',
+        'onlyshowchanges',
+        'lazy',
+        '_fields',
+        '_parent',
+        '_parent_field',
+        '_changed_fields',
+        '_changed_children',
+        '_source')
+
+    # The slots of the model and of its subclasses, so they can be pickled
+    _slot_names = __slots__
+
     is_model = True
 
-    def __init__(self, from_config=None, **kwargs):
-        self._fields = []
-        self._key_types = {}
+    # Models of a class are mostly loaded with the same fields in the same
+    # order, so the ordered tuples of field names are shared between them
+    _shared_fields = {}
+
+    _field_instances = {}
+    _field_defaults = {}
+    _relational_fields = frozenset()
+    _readonly_fields = frozenset()
+    _hidden_fields = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        module = cls.__module__
+
+        if module.startswith('configparity.models.'):
+            module = module[len('configparity.models.'):]
+
+        MODEL_REGISTRY[f'{module}.{cls.__name__}'] = cls
+
+        field_instances = {}
+
+        # Walk the MRO in reverse so fields on a subclass override its parents
+        for klass in reversed(cls.__mro__):
+            for name, attribute in vars(klass).items():
+                if getattr(attribute, 'is_field', False) and not isinstance(attribute, type):
+                    field_instances[name] = attribute
+
+                elif name in field_instances:
+                    del field_instances[name]
+
+        cls._slot_names = tuple(
+            name for klass in reversed(cls.__mro__) for name in vars(klass).get('__slots__', ()))
+        cls._field_instances = field_instances
+        cls._field_defaults = {name: field.default for name, field in field_instances.items()}
+        cls._relational_fields = frozenset(
+            name for name, field in field_instances.items() if field.is_relational)
+        cls._readonly_fields = frozenset(
+            name for name, field in field_instances.items() if field.readonly)
+        cls._hidden_fields = frozenset(
+            name for name, field in field_instances.items() if field.hide_from_changes)
+
+    def __init__(self, from_config=None, lazy=False, **kwargs):
+        self._fields = ()
 
         self.values = {}
-        self.readonly_keys = []
-        self.only_changes_keys = []
+        self.initial_values = None
         self.onlyshowchanges = False
+        self.lazy = lazy
+
+        self._parent = None
+        self._parent_field = None
+        self._changed_fields = NO_CHANGES
+        self._changed_children = NO_CHANGES
 
         if from_config:
             self.load_config(from_config)
@@ -40,43 +401,36 @@ class Model(object):
         else:
             self.load_dict(**kwargs)
 
-    def __setattr__(self, field, value):
-        if field in dir(self) or hasattr(self, field):
-            field_instance = object.__getattribute__(self, field)
-
-            if 'is_field' in dir(field_instance):
-                if 'is_relational' in dir(field_instance) and field_instance.is_relational:
-                    self.values[field] = field_instance(
-                        from_model=self,
-                        value=value,
-                        current=self.values.get(field))
+    def __getattr__(self, name):
+        # A child model's reference to the model it belongs to is kept only in its
+        # values, under the related name of the field that holds it
+        if name != 'values' and name in self.values:
+            return self.values[name]
 
-                else:
-                    self.values[field] = field_instance(
-                        value=value,
-                        current=self.values.get(field))
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-                return
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
 
-        object.__setattr__(self, field, value)
+        # The shared empty change journals and slots that were never set are
+        # left out, and the journals are set again on load
+        for name in self._slot_names:
+            value = getattr(self, name, NO_CHANGES)
 
-    def __getattribute__(self, field):
-        try:
-            if field in object.__getattribute__(self, 'values'):
-                return object.__getattribute__(self, 'values')[field]
+            if value is not NO_CHANGES:
+                state[name] = value
 
-        except AttributeError:
-            # this error is occurring because __getattribute__ is being called before __init__
-            object.__setattr__(self, 'values', {})
+        return state
 
-        field_instance = object.__getattribute__(self, field)
+    def __setstate__(self, state):
+        self._changed_fields = NO_CHANGES
+        self._changed_children = NO_CHANGES
 
-        if 'is_field' in dir(field_instance):
-            value = field_instance.default if 'default' in dir(field_instance) else None
-            object.__getattribute__(self, 'values')[field] = value
-            return value
+        for name, value in state.items():
+            if name == '_fields':
+                value = self._share_fields(tuple(value))
 
-        return field_instance
+            object.__setattr__(self, name, value)
 
     def __repr__(self):
         return "Model('')"
@@ -90,9 +444,9 @@ class Model(object):
 
         for field in self._fields or []:
             value = self.values.get(field)
-            field_instance = object.__getattribute__(self, field)
+            field_instance = self._field_instances.get(field)
 
-            if 'is_field' not in dir(field_instance):
+            if field_instance is None:
                 continue
 
             if isinstance(value, list) or isinstance(value, tuple):
@@ -131,36 +485,156 @@ class Model(object):
         return json.dumps(self.dictionary)
 
     def get_field_instance(self, field):
-        if field in dir(self) or hasattr(self, field):
-            return object.__getattribute__(self, field)
+        return self._field_instances.get(field)
 
-        return None
+    def set_field_value(self, field, value):
+        field_instance = self._field_instances.get(field)
+
+        if field_instance is None:
+            raise AttributeError(f"'{type(self).__name__}' model has no field '{field}'")
+
+        if field in self._relational_fields:
+            value = field_instance(
+                from_model=self,
+                value=value,
+                current=self.values.get(field))
+        else:
+            value = field_instance(
+                value=value,
+                current=self.values.get(field))
+
+        # The value is converted before the change is recorded, so an assignment
+        # the field refuses leaves the model unchanged
+        self.field_will_change(field)
+        self.values[field] = value
+
+    def field_will_change(self, field):
+        if self.initial_values is None:
+            return
+
+        self.initial_values.preserve(field)
+
+        if field not in self._changed_fields:
+            if self._changed_fields is NO_CHANGES:
+                self._changed_fields = {}
+
+            self._changed_fields[field] = True
+            self._report_change()
+
+    def child_will_change(self, field, child):
+        if self._changed_children is NO_CHANGES:
+            self._changed_children = {}
+
+        children = self._changed_children.setdefault(field, {})
+
+        if id(child) in children:
+            return
+
+        children[id(child)] = child
+        self._report_change()
+
+    def _report_change(self):
+        if self._parent is not None:
+            self._parent.child_will_change(self._parent_field, self)
+
+    @property
+    def readonly_keys(self):
+        return [field for field in self._fields if field in self._readonly_fields]
+
+    @property
+    def only_changes_keys(self):
+        return [field for field in self._fields if field in self._hidden_fields]
+
+    @property
+    def has_changes(self):
+        return bool(self._changed_fields or self._changed_children)
+
+    def changed_children(self, field):
+        """
+        Returns (position, child) pairs for the child models in a field that
+        changed since they were loaded, in the order they appear in the field
+        """
+        children = self._changed_children.get(field)
+        current = self.values.get(field)
+
+        if not children or current is None:
+            return []
+
+        if not isinstance(current, list):
+            return [(0, current)] if id(current) in children else []
+
+        # Fields are imported here, as they import this module
+        from configparity.fields.common import LazyList
+        from configparity.fields.common import iter_items
+
+        # list.index is cheaper for a handful of children than walking the whole list,
+        # but a lazy list is walked without building the items that were never read
+        if len(children) > 16 or isinstance(current, LazyList):
+            return [(i, child) for i, child in enumerate(iter_items(current)) if id(child) in children]
+
+        positions = []
+
+        for child in children.values():
+            try:
+                positions.append((current.index(child), child))
+            except ValueError:
+                continue
+
+        return sorted(positions, key=lambda position: position[0])
+
+    @staticmethod
+    def _added_items(current, initial):
+        if not initial:
+            return list(current)
+
+        try:
+            initial = set(initial)
+        except TypeError:
+            pass
+
+        return [item for item in current if item not in initial]
+
+    def _share_fields(self, fields):
+        return self._shared_fields.setdefault(fields, fields)
 
     def load_dict(self, **kwargs):
-        for field, value in kwargs.items():
-            field_instance = object.__getattribute__(self, field)
+        added = []
+
+        try:
+            for field, value in kwargs.items():
+                self.set_field_value(field, value)
 
-            if 'is_relational' in dir(field_instance) and field_instance.is_relational:
-                self.values[field] = field_instance(
-                    from_model=self,
-                    value=value,
-                    current=self.values.get(field))
-            else:
-                self.values[field] = field_instance(
-                    value=value,
-                    current=self.values.get(field))
+                if field not in self._fields:
+                    added.append(field)
 
-            if field not in self._fields:
-                self._fields.append(field)
+        finally:
+            # Fields set before one is refused are kept, as their values are
+            if added:
+                self._fields = self._share_fields(self._fields + tuple(added))
+
+        if self.initial_values is None:
+            self.initial_values = InitialValues(self.values)
+
+    def validate(self, values):
+        """
+        Checks values by field name without loading them, returning a
+        FieldError for each value its field would refuse
+        """
+        errors = []
+
+        for field, value in values.items():
+            field_instance = self._field_instances.get(field)
+
+            if field_instance is None:
+                errors.append(FieldError(field, value, f"'{type(self).__name__}' model has no field '{field}'"))
+                continue
 
-            if field_instance.readonly and field not in self.readonly_keys:
-                self.readonly_keys.append(field)
+            ok, _, error = field_instance.check(value, current=self.values.get(field), from_model=self)
 
-            if field_instance.hide_from_changes and field not in self.only_changes_keys:
-                self.only_changes_keys.append(field)
+            if not ok:
+                errors.append(FieldError(field, value, error))
 
-        if 'initial_values' not in dir(self):
-            object.__setattr__(self, 'initial_values', copy.deepcopy(self.values))
+        return errors
 
     def load_config(self, config):
         error = '"load_config" function has not be implemented for this model!'
@@ -185,40 +659,35 @@ class Model(object):
 
     @property
     def only_changes(self):
-        changes = {}
-
-        if 'initial_values' in dir(self) and 'values' in dir(self):
-            for key in self.readonly_keys:
-                initial = self.initial_values.get(key)
-
-                if initial and key not in self.only_changes_keys:
-                    changes[key] = initial
+        if self.initial_values is None or not self.has_changes:
+            return None
 
-            for key, current in self.values.items():
-                initial = self.initial_values.get(key)
+        changes = {}
+        only_changes_keys = self.only_changes_keys
 
-                if isinstance(current, list):
-                    current = [i for i in current if i not in initial]
+        for key in self.readonly_keys:
+            initial = self.initial_values.get(key)
 
-                has_changes = any([
-                    not isinstance(current, list) and initial != current,
-                    isinstance(current, list) and len(current) > 0])
+            if initial and key not in only_changes_keys:
+                changes[key] = initial
 
-                if has_changes and key not in self.only_changes_keys:
-                    changes[key] = current
+        for key in self._changed_fields:
+            current = self.values.get(key)
+            initial = self.initial_values.get(key)
 
-            for key, initial in self.initial_values.items():
-                current = self.values.get(key)
+            if isinstance(current, list):
+                current = self._added_items(current, initial)
 
-                if isinstance(current, list):
-                    current = [i for i in current if i not in initial]
+            has_changes = any([
+                not isinstance(current, list) and initial != current,
+                isinstance(current, list) and len(current) > 0])
 
-                has_changes = any([
-                    not isinstance(current, list) and initial != current,
-                    isinstance(current, list) and len(current) > 0])
+            if has_changes and key not in only_changes_keys:
+                changes[key] = current
 
-                if has_changes and key not in self.only_changes_keys:
-                    changes[key] = current
+        for key in self._changed_children:
+            if key not in only_changes_keys:
+                changes[key] = self.values.get(key)
 
         if changes == {}:
             return None
@@ -236,18 +705,20 @@ class Model(object):
 
 
 """
-This fancy code automatically imports modules from the files
-in the models folder upon initialization.
+Modules in the models folder are imported on first access rather
+than upon initialization, so importing a single model only pulls in
+the modules it actually uses.
 """
-modules = []
-
-for (_, name, _) in iter_modules([path.dirname(__file__)]):
-    modules.append(name)
-    imported_module = import_module('.' + name, package='configparity.models')
-    class_name = list(filter(lambda x: not x.startswith('__'), dir(imported_module)))
-
-del import_module
-del iter_modules
-del path
-del imported_module
-del class_name
+modules = [
+    'cisco']
+
+
+def __getattr__(name):
+    if name in modules:
+        return import_module('.' + name, package=__name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(modules))
@@ -1,6 +1,4 @@
 from importlib import import_module
-from pkgutil import iter_modules
-from os import path
 
 
 COMMENTS = ['!']
@@ -8,18 +6,21 @@ READONLY = [':', 'ASA', 'Cryptochecksum']
 
 
 """
-This fancy code automatically imports modules from the files
-in the models/cisco folder upon initialization.
+Modules in the models/cisco folder are imported on first access rather
+than upon initialization, so importing a single model only pulls in
+the modules it actually uses.
 """
-modules = []
-
-for (_, name, _) in iter_modules([path.dirname(__file__)]):
-    modules.append(name)
-    imported_module = import_module('.' + name, package='configparity.models.cisco')
-    class_name = list(filter(lambda x: not x.startswith('__'), dir(imported_module)))
-
-del import_module
-del iter_modules
-del path
-del imported_module
-del class_name
+modules = [
+    'asa',
+    'vlan']
+
+
+def __getattr__(name):
+    if name in modules:
+        return import_module('.' + name, package=__name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(modules))
@@ -1,17 +1,58 @@
 from importlib import import_module
-from pkgutil import iter_modules
-from os import path
+import mmap
+import os
+from configparity.fields import FieldError
+from configparity.models import ConfigLines
 from configparity.models import Model
+from configparity.models import ModelConfigException
+from configparity.models import read_text
+from configparity.models import source_digest
+from configparity.models import source_hash
+from configparity.models import tokenize
 from configparity.models.cisco import COMMENTS
 from configparity.models.cisco import READONLY
 from configparity.fields.common import BoolField
 from configparity.fields.common import StrField
+from configparity.fields.common import LazyList
 from configparity.fields.common import ListField
+from configparity.fields.common import iter_items
+from configparity.fields.common import iter_raw
 from configparity.fields.common import ModelField
+from configparity.fields.common import Unbuilt
 from configparity.fields.hardware import BytesField
 
 
+def _load_section(cls, field, batch):
+    """
+    Builds the models for one batch of a section in a worker process
+    """
+    placeholder = cls()
+    field_instance = cls._field_instances[field]
+
+    if isinstance(field_instance, ListField):
+        list_type = field_instance.list_type
+
+        return [list_type(from_model=placeholder, value=ConfigLines(lines)) for lines in batch]
+
+    return field_instance(from_model=placeholder, value=ConfigLines(batch))
+
+
+def _parse_cache(cache):
+    """
+    Returns the ParseCache for a cache option, importing the cache module
+    only when a cache is asked for
+    """
+    if cache is None:
+        return None
+
+    from configparity.cache import ParseCache
+
+    return ParseCache.from_option(cache)
+
+
 class ASA(Model):
+    __slots__ = ('workers', 'cache', 'sections', 'collect_errors', 'load_errors')
+
     access_group = ListField(list_type=ModelField('cisco.asa.access_group.AccessGroup', 'asa'))
     access_list = ModelField('cisco.asa.access_list.AccessList', 'asa')
     asa_version = StrField()
@@ -104,12 +145,137 @@ class ASA(Model):
         'asa_version',
         'cryptochecksum')
 
+    # Sections that do not refer to each other while loading, so they can be
+    # built in worker processes when the ASA is created with workers
+    PARALLEL_FIELDS = (
+        'access_list',
+        'nat',
+        'object',
+        'object_group',
+        'route')
+
+    # Sections with fewer lines than this are cheaper to build in this process
+    PARALLEL_MIN_LINES = 2000
+
+    # Each worker is handed this many batches of a section, to even out the load
+    PARALLEL_BATCHES_PER_WORKER = 4
+
+    def __init__(self, from_config=None, workers=None, cache=None, sections=None, collect_errors=False, **kwargs):
+        self.workers = workers
+        self.cache = _parse_cache(cache)
+        self.sections = self._check_sections(sections)
+        self.collect_errors = collect_errors
+        self.load_errors = []
+
+        super().__init__(from_config, **kwargs)
+
+    @classmethod
+    def _check_sections(cls, sections):
+        # A misspelled section would otherwise be kept as raw config without a word
+        if sections is None:
+            return None
+
+        sections = frozenset(sections)
+        unknown = sections.difference(cls.FIELD_ORDER)
+
+        if unknown:
+            names = ", ".join(sorted(f"'{name}'" for name in unknown))
+            raise ModelConfigException(f"'{cls.__name__}' model has no section {names}")
+
+        return sections
+
+    def is_lazy_field(self, field):
+        """
+        Whether a section is kept as raw config until it is read, either
+        because the ASA is lazy or because the section was not asked for
+        """
+        return self.lazy or (self.sections is not None and field not in self.sections)
+
+    def _lazy_value(self, field, value):
+        field_instance = self.get_field_instance(field)
+
+        if isinstance(field_instance, ListField):
+            return LazyList(value)
+
+        if isinstance(field_instance, ModelField):
+            return field_instance.model_class(from_config=value, lazy=True)
+
+        return value
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['workers'] = None
+        state['cache'] = None
+        state['sections'] = None
+
+        return state
+
     def __repr__(self):
         return f"ASA('{self.hostname}')"
 
     def __str__(self):
         return self.config
 
+    @classmethod
+    def from_lines(cls, lines, workers=None, cache=None, **kwargs):
+        """
+        Builds an ASA from any iterable of config lines, such as an open file,
+        without joining them into a single config string first.
+        """
+        return cls(from_config=iter(lines), workers=workers, cache=cache, **kwargs)
+
+    @classmethod
+    def from_file(cls, file_path, encoding='utf-8', workers=None, cache=None, **kwargs):
+        """
+        Builds an ASA from a config file, reading it line by line through a
+        memory map so large dumps never need to be held as one string.
+        With a cache, an unchanged file is loaded from its cached snapshot.
+        """
+        cache = _parse_cache(cache)
+
+        with open(file_path, 'rb') as config_file:
+            if os.fstat(config_file.fileno()).st_size == 0:
+                return cls(workers=workers, cache=cache, **kwargs)
+
+            with mmap.mmap(config_file.fileno(), 0, access=mmap.ACCESS_READ) as config_map:
+                asa = cls(workers=workers, cache=cache, **kwargs)
+                key = cache.key(cls, config_map, asa._cache_options()) if cache else None
+
+                if key and asa._load_cached(key):
+                    return asa
+
+                lines = (line.decode(encoding) for line in iter(config_map.readline, b''))
+                asa = cls.from_lines(lines, workers=workers, **kwargs)
+                asa.cache = cache
+
+                if key:
+                    cache.put(key, asa)
+
+                return asa
+
+    def _cache_options(self):
+        # Lazy, selective and error collecting loads are cached apart from full ones
+        return (
+            self.lazy,
+            tuple(sorted(self.sections)) if self.sections is not None else None,
+            self.collect_errors)
+
+    def _load_cached(self, key):
+        cached = self.cache.get(key) if self.cache else None
+
+        if not isinstance(cached, type(self)):
+            return False
+
+        # An ASA with nothing loaded yet takes the cached values as the ones it was loaded with
+        if not self._fields:
+            self.initial_values = None
+
+        # Loading the cached values points their back-references at this ASA
+        self.load_dict(**{field: cached.values.get(field) for field in cached._fields})
+        self.load_errors = list(getattr(cached, 'load_errors', []))
+
+        return True
+
     @staticmethod
     def parse_readonly(line):
         line = line[2:] if line.startswith(': ') else line
@@ -142,16 +308,41 @@ class ASA(Model):
 
         return dict()
 
-    def _parse_config_chunks(self, config_str):
+    def _parse_config_chunks(self, config):
         chunks = {}
-        chunk = ""
+
+        for field, chunk, readonly in self._iter_config_chunks(config):
+            self._add_chunk(chunks, field, chunk, readonly)
+
+        return chunks
+
+    @staticmethod
+    def _add_chunk(chunks, field, chunk, readonly):
+        # A read-only line replaces what was read for its field before it
+        if readonly or field not in chunks:
+            chunks[field] = []
+
+        chunks[field].append(chunk)
+
+    def _iter_config_chunks(self, config):
+        """
+        Yields the field, the ConfigLines view and whether it is read-only for
+        each chunk of a config, as soon as the chunk ends. Each view holds only
+        its own lines and tokens, so they are let go once it is built.
+        """
+        chunk_lines = []
+        chunk_tokens = []
         last_field = None
         last_subfield = None
         last_indented = False
 
-        for line in config_str.split('\n'):
-            indented = line.startswith(' ')
-            words = [word for word in line.split(' ') if word != '']
+        lines = config.split('\n') if isinstance(config, str) else config
+
+        for number, line in enumerate(lines):
+            line = line.rstrip('\r\n')
+            token = tokenize(line, number)
+            words = token.words
+            indented = token.depth > 0
             field = None
             subfield = None
 
@@ -164,7 +355,7 @@ class ASA(Model):
                 readonly_chunks = self.parse_readonly(line)
 
                 for this_field, this_line in readonly_chunks.items():
-                    chunks[this_field] = this_line
+                    yield this_field, ConfigLines(this_line), True
 
                 continue
 
@@ -182,13 +373,10 @@ class ASA(Model):
                 len(words) > 1 and subfield and subfield != last_subfield,
                 len(words) > 0 and not indented and last_indented])
 
-            if new_group:
-                if chunk != "":
-                    if last_field not in chunks:
-                        chunks[last_field] = []
-
-                    chunks[last_field].append(chunk)
-                    chunk = ""
+            if new_group and chunk_lines:
+                yield last_field, ConfigLines(chunk_lines, tokens=chunk_tokens), False
+                chunk_lines = []
+                chunk_tokens = []
 
             last_indented = indented
 
@@ -198,38 +386,436 @@ class ASA(Model):
             if subfield:
                 last_subfield = field
 
-            chunk += f"\n{line}" if chunk != "" else line
+            chunk_lines.append(line)
+            chunk_tokens.append(token)
 
-        return chunks
+    def _section_batches(self, field, chunks):
+        batch_count = self.workers * self.PARALLEL_BATCHES_PER_WORKER
 
-    def load_config(self, config_str):
-        config_chunks = self._parse_config_chunks(config_str)
+        if isinstance(self.get_field_instance(field), ListField):
+            items = [list(chunk) for chunk in chunks]
+        else:
+            items = list(ConfigLines.join(chunks))
+
+        size = max(1, -(-len(items) // batch_count))
+
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
+    def _load_parallel(self, config_chunks):
+        """
+        Builds the large sections in PARALLEL_FIELDS across a process pool and
+        returns their values, ready to be loaded with the rest of the config
+        """
+        sections = {}
+
+        for field in self.PARALLEL_FIELDS:
+            chunks = config_chunks.get(field)
+
+            if self.is_lazy_field(field):
+                continue
+
+            if chunks and sum(len(chunk) for chunk in chunks) >= self.PARALLEL_MIN_LINES:
+                sections[field] = chunks
+
+        if not sections:
+            return {}
+
+        # The process pool is only imported once a section is large enough to need it
+        from concurrent.futures import ProcessPoolExecutor
 
         config = {}
 
-        for field in self.FIELD_ORDER:
-            value = config_chunks.get(field)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {}
+
+            for field, chunks in sections.items():
+                futures[field] = [
+                    executor.submit(_load_section, type(self), field, batch)
+                    for batch in self._section_batches(field, chunks)]
 
-            if value:
+            for field, batch_futures in futures.items():
+                parts = [future.result() for future in batch_futures]
                 field_instance = self.get_field_instance(field)
 
-                if not isinstance(field_instance, ListField):
-                    value = '\n'.join(value)
+                # Back-references to this ASA are set again when the values are loaded
+                if isinstance(field_instance, ListField):
+                    config[field] = [item for part in parts for item in part]
+                else:
+                    config[field] = field_instance.model_class.merge(parts)
+
+        return config
+
+    def load_config(self, config):
+        key = None
+
+        if self.cache:
+            if not isinstance(config, str):
+                config = '\n'.join(line.rstrip('\r\n') for line in config)
+
+            key = self.cache.key(type(self), config, self._cache_options())
+
+            if self._load_cached(key):
+                return
+
+        self._load_config(config)
+
+        if key:
+            self.cache.put(key, self)
+
+    def _section_value(self, field, chunks):
+        value = chunks
+
+        if value:
+            field_instance = self.get_field_instance(field)
+
+            if not isinstance(field_instance, ListField):
+                value = ConfigLines.join(value)
+
+            if isinstance(field_instance, BoolField):
+                value = False if str(value).startswith("no ") else True
+
+            if isinstance(field_instance, StrField) or isinstance(field_instance, BytesField):
+                value = ' '.join(str(value).split(' ')[1:])
+
+        return value
+
+    def _streams_section(self, field):
+        """
+        Whether a section is built as soon as each of its chunks is read, so the
+        lines and tokens of the chunk can be let go before the rest is read
+        """
+        if self.collect_errors or self.is_lazy_field(field):
+            return False
+
+        if self.workers and self.workers > 1 and field in self.PARALLEL_FIELDS:
+            return False
+
+        field_instance = self.get_field_instance(field)
+
+        if isinstance(field_instance, ListField):
+            return True
+
+        # Models built from parts of a section are combined through their merge
+        return isinstance(field_instance, ModelField) and hasattr(field_instance.model_class, 'merge')
+
+    def _build_chunk(self, field, chunk):
+        field_instance = self.get_field_instance(field)
+
+        if not isinstance(field_instance, ListField):
+            return field_instance(from_model=self, value=chunk)
+
+        try:
+            item = field_instance.convert_item(chunk, from_model=self)
+
+        except Exception:
+            field_instance.field_value_exception(chunk)
+
+        if getattr(item, 'is_model', False):
+            item._source = source_digest(chunk)
+
+        return item
+
+    def _stream_sections(self, config):
+        """
+        Reads the chunks of a config, building the sections that can be built
+        as each chunk is read. Returns the built parts and the digest of the text
+        of each of those sections, and the chunks of the sections left to build
+        """
+        fields = set(self.FIELD_ORDER)
+        config_chunks = {}
+        parts = {}
+        digests = {}
+
+        for field, chunk, readonly in self._iter_config_chunks(config):
+            if field not in fields:
+                continue
+
+            if not self._streams_section(field):
+                self._add_chunk(config_chunks, field, chunk, readonly)
+                continue
+
+            parts.setdefault(field, []).append(self._build_chunk(field, chunk))
+
+            # Sections are compared by the digest of their chunks joined by line breaks
+            if field in digests:
+                digests[field].update(b'\n')
+            else:
+                digests[field] = source_hash()
+
+            digests[field].update(read_text(chunk).encode())
 
-                if isinstance(field_instance, BoolField):
-                    value = False if value.startswith("no ") else True
+        return parts, digests, config_chunks
 
-                if isinstance(field_instance, StrField) or isinstance(field_instance, BytesField):
-                    value = ' '.join(value.split(' ')[1:])
+    def _load_config(self, config):
+        parts, digests, config_chunks = self._stream_sections(config)
+
+        config = {}
+
+        # Errors are collected as each section is built, which is done here
+        if self.workers and self.workers > 1 and not self.collect_errors:
+            config = self._load_parallel(config_chunks)
+
+        for field in self.FIELD_ORDER:
+            if field in config:
+                continue
+
+            if field in parts:
+                config[field] = self._merge_parts(field, parts.pop(field), digests[field])
+                continue
+
+            chunks = config_chunks.get(field)
+
+            # Lazy sections are kept as raw chunks until they are read, and tokenized again then
+            if chunks and self.is_lazy_field(field):
+                chunks = config_chunks[field] = [chunk.without_tokens() for chunk in chunks]
+
+            value = self._section_value(field, chunks)
+
+            if value and self.is_lazy_field(field):
+                value = self._lazy_value(field, value)
+
+            elif value and self.collect_errors:
+                value, config_chunks[field], errors = self._check_section(field, value, chunks)
+                self.load_errors.extend(errors)
 
             config[field] = value
 
         self.load_dict(**config)
+        self._record_sources(config_chunks)
+
+    def _merge_parts(self, field, parts, digest):
+        if isinstance(self.get_field_instance(field), ListField):
+            return parts
+
+        value = parts[0] if len(parts) == 1 else type(parts[0]).merge(parts)
+        value._source = digest.digest()
+
+        return value
+
+    def _load_error(self, field, config, message):
+        tokens = config.tokens if isinstance(config, ConfigLines) else None
+        line = tokens[0].number + 1 if tokens else None
+
+        return FieldError(field, str(config), message, line)
+
+    def _check_section(self, field, value, chunks):
+        """
+        Builds a section without raising, for an ASA that collects errors.
+        Returns the built value, the chunks it was built from and a FieldError
+        for each part of the section that was refused and left out
+        """
+        field_instance = self.get_field_instance(field)
+
+        if isinstance(field_instance, ListField):
+            built = []
+            kept = []
+            errors = []
+
+            for chunk in value:
+                ok, item, error = field_instance.list_type.check(chunk, from_model=self)
+
+                if ok:
+                    built.append(item)
+                    kept.append(chunk)
+                else:
+                    errors.append(self._load_error(field, chunk, error))
+
+            return built, kept, errors
+
+        ok, built, error = field_instance.check(value, from_model=self)
+
+        if ok:
+            return built, chunks, []
+
+        if not isinstance(field_instance, ModelField) or not isinstance(value, ConfigLines):
+            return None, chunks, [self._load_error(field, value, error)]
+
+        # Find the lines that are refused on their own, and build the section from the rest
+        kept = []
+        errors = []
+
+        for view in value.views():
+            ok, _, line_error = field_instance.check(view, from_model=self)
+
+            if ok:
+                kept.append(view)
+            else:
+                errors.append(self._load_error(field, view, line_error))
+
+        if not errors or not kept:
+            return None, chunks, errors or [self._load_error(field, value, error)]
+
+        ok, built, error = field_instance.check(ConfigLines.join(kept), from_model=self)
+
+        if not ok:
+            return None, chunks, [self._load_error(field, value, error)]
+
+        return built, chunks, errors
+
+    def _record_sources(self, config_chunks):
+        # Section models remember a digest of the text they were built from,
+        # so reload_config can tell which of them changed
+        for field in self.FIELD_ORDER:
+            field_instance = self.get_field_instance(field)
+            chunks = config_chunks.get(field)
+            current = self.values.get(field)
+
+            if not chunks or current is None:
+                continue
+
+            if isinstance(field_instance, ListField):
+                for chunk, instance in zip(chunks, iter_raw(current)):
+                    if getattr(instance, 'is_model', False):
+                        instance._source = source_digest(chunk)
+
+            elif isinstance(field_instance, ModelField):
+                current._source = source_digest(ConfigLines.join(chunks))
+
+    def _reload_list(self, field, field_instance, chunks, current):
+        previous = {}
+
+        # Items of a lazy list that were never read are compared by their raw text,
+        # and their placeholders are kept, so they are still the same items after
+        for instance in iter_items(current):
+            if type(instance) is Unbuilt:
+                source = source_digest(instance.raw)
+            elif not getattr(instance, 'is_model', False):
+                source = source_digest(instance)
+            elif instance.has_changes:
+                continue
+            else:
+                source = getattr(instance, '_source', None)
+
+            if source is not None:
+                previous.setdefault(source, []).append(instance)
+
+        lazy = self.is_lazy_field(field)
+        value = []
+
+        for chunk in chunks:
+            source = source_digest(chunk)
+            kept = previous.get(source)
+
+            if kept:
+                instance = kept.pop(0)
+            elif lazy:
+                instance = Unbuilt(chunk)
+            else:
+                instance = field_instance.list_type(from_model=self, value=chunk)
+                instance._source = source
+
+            value.append(instance)
+
+        return LazyList.from_items(value) if lazy else value
+
+    def _reload_model(self, field, field_instance, chunks, current):
+        if not chunks:
+            return None
+
+        view = ConfigLines.join(chunks)
+        source = source_digest(view)
+
+        if current is not None and not current.has_changes and getattr(current, '_source', None) == source:
+            return current
+
+        if current is not None and hasattr(current, 'reload_config'):
+            current.reload_config(view)
+        elif self.is_lazy_field(field):
+            current = self._lazy_value(field, view)
+        else:
+            current = field_instance(from_model=self, value=view)
+
+        current._source = source
+
+        return current
+
+    def reload_config(self, config):
+        """
+        Loads a new version of the config, only rebuilding the section models
+        whose text changed. Models of unchanged sections are kept as they are,
+        and the differences are recorded as changes, so only_changes shows
+        what the new config changed.
+        """
+        config_chunks = self._parse_config_chunks(config)
+        changes = {}
+
+        for field in self.FIELD_ORDER:
+            field_instance = self.get_field_instance(field)
+            chunks = config_chunks.get(field)
+            current = self.values.get(field)
+
+            if isinstance(field_instance, ListField):
+                value = self._reload_list(field, field_instance, chunks or [], current or [])
+
+                if list(map(id, iter_items(value))) == list(map(id, iter_items(current))):
+                    continue
+
+            elif isinstance(field_instance, ModelField):
+                value = self._reload_model(field, field_instance, chunks, current)
+
+                if value is current:
+                    continue
+
+            else:
+                value = self._section_value(field, chunks)
+
+                # Values are compared as the field stores them, such as a RAM size in bytes
+                if value == current or value is not None and field_instance(value=value) == current:
+                    continue
+
+            changes[field] = value
+
+        self.load_dict(**changes)
 
     @property
     def is_valid(self):
         return False
 
+    def _list_changes(self, field):
+        current_value = self.values.get(field) or []
+        initial_value = self.initial_values.get(field) or []
+        lines = []
+
+        if field not in self._changed_fields:
+            instances = [instance for _, instance in self.changed_children(field)]
+            initial_ids = None
+
+        else:
+            # Items of a lazy list that were never read are left unbuilt, unless they were removed
+            instances = list(iter_items(current_value))
+            initial_ids = {id(instance) for instance in iter_items(initial_value)}
+            current_ids = {id(instance) for instance in instances}
+            lines.extend(self._removed_lines(initial_value, current_ids))
+
+        for index, instance in enumerate(instances):
+            if type(instance) is Unbuilt:
+                if id(instance) in initial_ids:
+                    continue
+
+                instance = current_value[index]
+
+            if not (hasattr(instance, 'is_model') and instance.is_model):
+                lines.append(f"{instance}")
+
+            elif initial_ids is not None and id(instance) not in initial_ids:
+                lines.append(instance.config)
+
+            else:
+                lines.append(instance.only_changes)
+
+        return "\n".join(line for line in lines if line)
+
+    @staticmethod
+    def _removed_lines(initial_value, current_ids):
+        for index, instance in enumerate(iter_items(initial_value)):
+            if id(instance) in current_ids:
+                continue
+
+            instance = initial_value[index]
+
+            if hasattr(instance, 'remove_config'):
+                yield instance.remove_config
+
     @property
     def only_changes(self):
         config = ""
@@ -238,6 +824,9 @@ class ASA(Model):
             if field in self.READONLY_FIELDS:
                 continue
 
+            if field not in self._changed_fields and field not in self._changed_children:
+                continue
+
             current_value = self.values.get(field)
             initial_value = self.initial_values.get(field)
             command = field.replace("_", "-")
@@ -245,13 +834,7 @@ class ASA(Model):
             add = ""
 
             if isinstance(field_instance, ListField):
-                for instance in current_value or []:
-                    if hasattr(instance, 'is_model') and instance.is_model:
-                        this_config = instance.only_changes or ""
-                    else:
-                        this_config = f"{instance}"
-
-                    add += this_config if add == "" else f"\n{this_config}"
+                add = self._list_changes(field)
 
             if isinstance(field_instance, BoolField):
                 if current_value and current_value != initial_value:
@@ -289,9 +872,10 @@ class ASA(Model):
             current = self.values.get(field)
             key = field.replace("_", "-")
 
+            # Items of a lazy list that were never read are written out as they were read
             if isinstance(field_instance, ListField):
-                for instance in current or []:
-                    this_config = instance.config
+                for instance in iter_raw(current):
+                    this_config = instance.config if getattr(instance, 'is_model', False) else read_text(instance)
                     add += this_config if add == "" else f"\n{this_config}"
 
             if isinstance(field_instance, BoolField):
@@ -311,18 +895,37 @@ class ASA(Model):
 
 
 """
-This fancy code automatically imports modules from the files
-in the models/cisco/asa folder upon initialization.
+Modules in the models/cisco/asa folder are imported on first access rather
+than upon initialization, so importing a single model only pulls in
+the modules it actually uses.
 """
-modules = []
-
-for (_, name, _) in iter_modules([path.dirname(__file__)]):
-    modules.append(name)
-    imported_module = import_module('.' + name, package='configparity.models.cisco.asa')
-    class_name = list(filter(lambda x: not x.startswith('__'), dir(imported_module)))
-
-del import_module
-del iter_modules
-del path
-del imported_module
-del class_name
+modules = [
+    'access_control_entry',
+    'access_group',
+    'access_list',
+    'banner',
+    'enable',
+    'failover',
+    'interface',
+    'ip',
+    'ip_audit',
+    'ip_local_pool',
+    'ip_verify',
+    'logging',
+    'name',
+    'nat',
+    'object',
+    'object_group',
+    'passwd',
+    'route']
+
+
+def __getattr__(name):
+    if name in modules:
+        return import_module('.' + name, package=__name__)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(modules))
@@ -1,4 +1,6 @@
 from configparity.models import Model
+from configparity.models import read_text
+from configparity.models import read_tokens
 from configparity.fields.common import AllowedField
 from configparity.fields.common import BoolField
 from configparity.fields.common import IntField
@@ -9,6 +11,8 @@ import ipaddress
 
 
 class AccessControlEntry(Model):
+    __slots__ = ()
+
     ALLOWED_PROTOCOLS = [
         "ah", "eigrp", "esp", "gre", "icmp", "icmp6", "igmp",
         "igrp", "ip", "ipinip", "ipsec", "nos", "ospf",
@@ -207,9 +211,10 @@ class AccessControlEntry(Model):
         return config
 
     def load_config(self, config_str):
-        line = config_str.split(' ')
+        tokens = read_tokens(config_str)
+        line = list(tokens[0].words) if tokens else []
 
-        is_valid = all([
+        is_valid = len(line) > 2 and all([
             line[0] == 'access-list',
             line[1] not in ['alert-interval', 'deny-flow-max']])
 
@@ -218,7 +223,7 @@ class AccessControlEntry(Model):
 
         config = {
             'name': line[1],
-            'input_line': config_str}
+            'input_line': read_text(config_str)}
 
         line = line[2:]
         new_config = None
@@ -1,8 +1,11 @@
 from configparity.models import Model
+from configparity.models import first_words
 from configparity.fields.common import StrField
 
 
 class AccessGroup(Model):
+    __slots__ = ()
+
     name = StrField(readonly=True)
     traffic = StrField(readonly=True, allowed=['global', 'in', 'out'])
     if_name = StrField(readonly=True)
@@ -14,7 +17,7 @@ class AccessGroup(Model):
         return "AccessGroup('{}')".format(self.name)
 
     def load_config(self, config_str):
-        config_str = config_str.split(' ')
+        config_str = first_words(config_str)
 
         is_valid = all([
             config_str[0] == 'access-group',
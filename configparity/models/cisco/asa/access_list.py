@@ -1,10 +1,23 @@
+from itertools import islice
 from configparity.models import Model
+from configparity.models import ConfigLines
+from configparity.models import read_text
 from configparity.fields.common import IntField
+from configparity.fields.common import LazyList
 from configparity.fields.common import ListField
+from configparity.fields.common import iter_items
+from configparity.fields.common import iter_raw
 from configparity.fields.common import ModelField
+from configparity.fields.common import Unbuilt
 
 
 class AccessList(Model):
+    __slots__ = ()
+
+    # Past this many inserted and removed entries the diff stops looking for
+    # the shortest edit and replaces the differing part of the list instead
+    DIFF_MAX_EDITS = 1000
+
     alert_interval = IntField(low=1, high=3600, default=300)
     deny_flow_max = IntField(low=1, high=4096, default=4096)
     entries = ListField(list_type=ModelField(
@@ -17,24 +30,93 @@ class AccessList(Model):
     def __repr__(self):
         return f"AccessList('{len(self.entries)} Entries')"
 
+    @classmethod
+    def merge(cls, access_lists):
+        """
+        Combines access lists loaded from consecutive parts of one config
+        into a single access list, keeping the entries in order
+        """
+        config = {'entries': []}
+
+        for access_list in access_lists:
+            if access_list is None:
+                continue
+
+            for field in ['alert_interval', 'deny_flow_max']:
+                if field in access_list._fields:
+                    config[field] = access_list.values.get(field)
+
+            config['entries'].extend(access_list.values.get('entries') or [])
+
+        return cls(**config)
+
     def load_config(self, config_str):
-        config_lines = config_str.splitlines()
+        self.load_dict(**self._read_config(config_str))
+
+    def _read_config(self, config_str):
+        if not isinstance(config_str, ConfigLines):
+            config_str = ConfigLines(config_str.splitlines())
+
         config = {'entries': []}
 
-        for line in config_lines:
-            line = line.split(' ')
+        # Entries are handed on as single line views, so they reuse these tokens
+        for line, token in zip(config_str.views(), config_str.tokens):
+            words = token.words
 
-            if line[0] != 'access-list':
+            if len(words) < 2 or words[0] != 'access-list':
                 continue
 
-            field = line[1]
+            field = words[1]
 
             if field not in ['alert-interval', 'deny-flow-max']:
-                config['entries'].append(" ".join(line))
+                config['entries'].append(line)
                 continue
 
             field = field.replace('-', '_')
-            config[field] = line[2]
+            config[field] = words[2]
+
+        if self.lazy:
+            config['entries'] = LazyList(config['entries'])
+
+        return config
+
+    def reload_config(self, config_str):
+        """
+        Loads a new version of the access list, keeping the entries whose
+        line is unchanged and only building entries for new lines
+        """
+        config = self._read_config(config_str)
+        previous = {}
+
+        # Entries of a lazy access list that were never read are compared by their
+        # raw line, and their placeholders are kept, so they are still the same entries
+        for entry in iter_items(self.entries):
+            if type(entry) is Unbuilt:
+                previous.setdefault(read_text(entry.raw), []).append(entry)
+
+            elif not entry.has_changes:
+                previous.setdefault(entry.input_line, []).append(entry)
+
+        entries = []
+
+        for line in iter_raw(config.pop('entries')):
+            kept = previous.get(read_text(line))
+
+            if kept:
+                entries.append(kept.pop(0))
+            else:
+                entries.append(Unbuilt(line) if self.lazy else line)
+
+        if [id(entry) for entry in entries] != [id(entry) for entry in iter_items(self.entries)]:
+            config['entries'] = LazyList.from_items(entries) if self.lazy else entries
+
+        for field in ['alert_interval', 'deny_flow_max']:
+            current = self.values.get(field) if field in self._fields else None
+
+            if str(config.get(field)) == str(current):
+                config.pop(field, None)
+            else:
+                config[field] = config.get(field)
 
         self.load_dict(**config)
 
@@ -55,35 +137,263 @@ class AccessList(Model):
         if self.deny_flow_max and self.deny_flow_max != 4096:
             config += f"access-list deny-flow-max {self.deny_flow_max}\n"
 
-        line = 1
-        remove_entries = []
+        # Entries of a lazy access list that were never read are written out as they were read
+        for entry in iter_raw(self.entries):
+            entry_config = entry.config if getattr(entry, 'is_model', False) else read_text(entry)
+
+            if entry_config:
+                config += f"{entry_config}\n"
+
+        if config[-1:] == "\n":
+            config = config[:-1]
+
+        return config
+
+    @classmethod
+    def diff(cls, initial, current):
+        """
+        Myers' diff of two sequences, returned as a list of
+        ('equal' | 'delete' | 'insert', item) tuples in sequence order
+        """
+        trace = cls._diff_trace(initial, current)
+
+        if trace is None:
+            return [('delete', item) for item in initial] + [('insert', item) for item in current]
+
+        return cls._diff_ops(trace, initial, current)
 
-        for entry in self.entries:
-            entry_config = None
+    @classmethod
+    def _diff_trace(cls, initial, current):
+        """
+        Walks the edit graph forward, keeping the furthest reaching paths of
+        every edit count, or returns None past DIFF_MAX_EDITS edits
+        """
+        n = len(initial)
+        m = len(current)
+        v = {1: 0}
+        trace = []
 
-            if self.onlyshowchanges:
-                new = entry.config
-                initial = entry.initial_config
+        for d in range(n + m + 1):
+            if d > cls.DIFF_MAX_EDITS:
+                return None
 
-                if new != initial:
-                    new = new.split(' ')
-                    new = " ".join(new[0:2]) + f" line {line} " + " ".join(new[2:])
+            trace.append(dict(v))
 
-                    remove_entries.append(initial)
-                    entry_config = new
+            for k in range(-d, d + 1, 2):
+                x = v[k + 1] if k == -d or (k != d and v[k - 1] < v[k + 1]) else v[k - 1] + 1
+                y = x - k
 
+                while x < n and y < m and initial[x] == current[y]:
+                    x += 1
+                    y += 1
+
+                v[k] = x
+
+                if x >= n and y >= m:
+                    return trace
+
+        return trace
+
+    @staticmethod
+    def _diff_ops(trace, initial, current):
+        """
+        Walks the trace of the edit graph back from its end into the edits
+        """
+        ops = []
+        x = len(initial)
+        y = len(current)
+
+        for d in range(len(trace) - 1, -1, -1):
+            v = trace[d]
+            k = x - y
+
+            if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+                previous_k = k + 1
             else:
-                entry_config = entry.config
+                previous_k = k - 1
 
-            if entry_config:
-                config += f"{entry_config}\n"
+            previous_x = v.get(previous_k, 0)
+            previous_y = previous_x - previous_k
 
-            line += 1
+            while x > previous_x and y > previous_y:
+                x -= 1
+                y -= 1
+                ops.append(('equal', current[y]))
 
-        if config[-1:] == "\n":
-            config = config[:-1]
+            if d > 0:
+                if x == previous_x:
+                    ops.append(('insert', current[previous_y]))
+                else:
+                    ops.append(('delete', initial[previous_x]))
 
-        for entry in remove_entries:
-            config += f"\nno {entry}"
+            x = previous_x
+            y = previous_y
 
-        return config
+        ops.reverse()
+
+        return ops
+
+    @staticmethod
+    def _trim_unchanged(initial_items, current_items, changed):
+        """
+        Returns where the entries that differ start, and where they end in the
+        initial and in the current entries, leaving out the common prefix and
+        suffix of entries that are the same object and were not edited
+        """
+        limit = min(len(initial_items), len(current_items))
+        start = 0
+
+        while start < limit and initial_items[start] is current_items[start]:
+            if id(current_items[start]) in changed:
+                break
+
+            start += 1
+
+        end_initial = len(initial_items)
+        end_current = len(current_items)
+
+        while end_initial > start and end_current > start:
+            entry = current_items[end_current - 1]
+
+            if initial_items[end_initial - 1] is not entry or id(entry) in changed:
+                break
+
+            end_initial -= 1
+            end_current -= 1
+
+        return start, end_initial, end_current
+
+    @staticmethod
+    def _group_by_name(entries, changed, attribute):
+        """
+        Groups entries by access list name, unedited entries as themselves and
+        edited ones as the text of their config attribute
+        """
+        names = {}
+
+        for entry in entries:
+            key = getattr(entry, attribute) if id(entry) in changed else entry
+            names.setdefault(entry.name, []).append(key)
+
+        return names
+
+    @staticmethod
+    def _entry_name(entry):
+        # An entry that was never read is named by the second word of its raw line
+        if getattr(entry, 'is_model', False):
+            return entry.name
+
+        return read_text(entry.raw).split(' ')[1]
+
+    @classmethod
+    def _name_changes(cls, initial, current, position):
+        """
+        Renders the diff of the entries of one access list into the lines
+        removed first, the lines inserted and the lines removed last
+        """
+        ops = []
+
+        for op, key in cls.diff(initial, current):
+            text = key if isinstance(key, str) or key is None else key.config
+
+            if text:
+                ops.append((op, text))
+
+        # An entry that moves is removed before it is added back,
+        # every other removal waits until the insertions are in
+        moved = {text for op, text in ops if op == 'insert'} & {text for op, text in ops if op == 'delete'}
+        remove_first = []
+        lines = []
+        remove_last = []
+
+        for op, text in ops:
+            if op == 'delete' and text in moved:
+                remove_first.append(f"no {text}")
+                continue
+
+            position += 1
+
+            if op == 'insert':
+                words = text.split(' ')
+                lines.append(" ".join(words[0:2]) + f" line {position} " + " ".join(words[2:]))
+
+            elif op == 'delete':
+                remove_last.append(f"no {text}")
+
+        return remove_first, lines, remove_last
+
+    def _entries_changes(self):
+        initial = self.initial_values.get('entries') or []
+        current = self.values.get('entries') or []
+        changed = self._changed_children.get('entries') or {}
+
+        if 'entries' in self._changed_fields:
+            # Entries of a lazy list are compared without building them
+            start, end_initial, end_current = self._trim_unchanged(
+                list(iter_items(initial)), list(iter_items(current)), changed)
+
+        else:
+            # With only edited entries the list is the same, so the entries that
+            # differ are the edited ones and those between them
+            positions = [position for position, _ in self.changed_children('entries')]
+
+            if not positions:
+                return []
+
+            start = positions[0]
+            end_initial = end_current = positions[-1] + 1
+
+        if start == end_initial and start == end_current:
+            return []
+
+        # Unedited entries are compared by identity and edited ones by their text,
+        # so only the entries that end up in the output get rendered
+        initial_names = self._group_by_name(initial[start:end_initial], changed, 'initial_config')
+        current_names = self._group_by_name(current[start:end_current], changed, 'config')
+        offsets = dict.fromkeys(list(initial_names) + list(current_names), 0)
+
+        for entry in islice(iter_items(current), start):
+            name = self._entry_name(entry)
+
+            if name in offsets:
+                offsets[name] += 1
+
+        lines = []
+        remove_first = []
+        remove_last = []
+
+        for name, position in offsets.items():
+            changes = self._name_changes(initial_names.get(name, []), current_names.get(name, []), position)
+            remove_first += changes[0]
+            lines += changes[1]
+            remove_last += changes[2]
+
+        return remove_first + lines + remove_last
+
+    @property
+    def only_changes(self):
+        if self.initial_values is None or not self.has_changes:
+            return None
+
+        lines = []
+
+        for field in ['alert_interval', 'deny_flow_max']:
+            if field not in self._changed_fields:
+                continue
+
+            current = self.values.get(field)
+            initial = self.initial_values.get(field)
+            command = field.replace('_', '-')
+
+            if current and current != initial:
+                lines.append(f"access-list {command} {current}")
+
+            elif initial and not current:
+                lines.append(f"no access-list {command} {initial}")
+
+        lines += self._entries_changes()
+
+        if len(lines) == 0:
+            return None
+
+        return "\n".join(lines)
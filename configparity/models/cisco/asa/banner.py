@@ -1,8 +1,11 @@
 from configparity.models import Model
+from configparity.models import read_lines
 from configparity.fields.common import StrField
 
 
 class Banner(Model):
+    __slots__ = ()
+
     asdm = StrField()
     exec = StrField()
     login = StrField()
@@ -30,7 +33,7 @@ class Banner(Model):
         return banner_type
 
     def load_config(self, config_str):
-        lines = config_str.splitlines()
+        lines = read_lines(config_str)
         config = {}
         banner_type = None
 
@@ -1,10 +1,13 @@
 from configparity.models import Model
+from configparity.models import first_words
 from configparity.fields.common import StrField
 from configparity.fields.common import BoolField
 from configparity.fields.common import IntField
 
 
 class Enable(Model):
+    __slots__ = ()
+
     password = StrField()
     encrypted = BoolField(default=False)
     level = IntField(low=0, high=15, default=0)
@@ -17,7 +20,7 @@ class Enable(Model):
         return self.config
 
     def load_config(self, config_str):
-        config_str = config_str.split(' ')
+        config_str = first_words(config_str)
 
         is_valid = all([
             config_str[0] == 'enable',
@@ -1,4 +1,5 @@
 from configparity.models import Model
+from configparity.models import read_lines
 from configparity.fields.common import AllowedField
 from configparity.fields.common import BoolField
 from configparity.fields.common import IntField
@@ -10,6 +11,8 @@ from configparity.fields.networking import MACAddressField
 
 
 class Failover(Model):
+    __slots__ = ()
+
     failover = BoolField(default=False)
     interface_active_ip = IPAddressField()
     interface_ip_name = StrField()
@@ -88,7 +91,7 @@ class Failover(Model):
         return config
 
     def load_config(self, config_str):
-        config_lines = config_str.splitlines()
+        config_lines = read_lines(config_str)
         config = {}
 
         if 'failover' not in config_lines[0]:
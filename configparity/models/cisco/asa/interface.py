@@ -1,4 +1,5 @@
 from configparity.models import Model
+from configparity.models import read_tokens
 from configparity.models.cisco import COMMENTS
 from configparity.fields.common import AllowedField
 from configparity.fields.common import BoolField
@@ -14,6 +15,8 @@ from configparity.fields.networking import VLANField
 
 
 class Interface(Model):
+    __slots__ = ()
+
     authentication_keys = ListField(default=[], list_type=DictField())
     authentication_modes = ListField(default=[], list_type=DictField())
     channel_group = IntField()
@@ -346,10 +349,10 @@ class Interface(Model):
         return config
 
     def load_config(self, config_str):
-        config_lines = [(line[1:] if line.startswith(' ') else line) for line in config_str.splitlines()]
+        config_tokens = [token for token in read_tokens(config_str) if token.words]
         config = {}
 
-        if 'interface' not in config_lines[0]:
+        if not config_tokens or 'interface' not in config_tokens[0].words:
             return None
 
         parsers = [
@@ -375,8 +378,8 @@ class Interface(Model):
             'split_horizon',
             'summary_address']
 
-        for line in config_lines:
-            line = line.split(' ')
+        for token in config_tokens:
+            line = list(token.words)
             field = line[0].replace('-', '_')
 
             if field in COMMENTS:
@@ -1,9 +1,12 @@
 from configparity.models import Model
+from configparity.models import read_lines
 from configparity.fields.common import ListField
 from configparity.fields.common import ModelField
 
 
 class IP(Model):
+    __slots__ = ()
+
     audit = ListField(list_type=ModelField('cisco.asa.ip_audit.IPAudit', 'asa'))
     local = ListField(list_type=ModelField('cisco.asa.ip_local_pool.IPLocalPool', 'asa'))
     verify = ListField(list_type=ModelField('cisco.asa.ip_verify.IPVerify', 'asa'))
@@ -15,7 +18,7 @@ class IP(Model):
         return f"IP()"
 
     def load_config(self, config_str):
-        config_lines = config_str.splitlines()
+        config_lines = read_lines(config_str)
         config = {'audit': [], 'local': [], 'verify': []}
 
         for line in config_lines:
@@ -6,6 +6,8 @@ from configparity.fields.common import StrField
 
 
 class IPAudit(Model):
+    __slots__ = ()
+
     interface = StrField()
     specification_name = StrField()
     name = StrField()
@@ -4,6 +4,8 @@ from configparity.fields.networking import IPAddressField
 
 
 class IPLocalPool(Model):
+    __slots__ = ()
+
     name = StrField()
     start = IPAddressField()
     end = IPAddressField()
@@ -3,6 +3,8 @@ from configparity.fields.common import StrField
 
 
 class IPVerify(Model):
+    __slots__ = ()
+
     reverse_path_interface = StrField()
 
     def __repr__(self):
@@ -1,4 +1,5 @@
 from configparity.models import Model
+from configparity.models import read_lines
 from configparity.fields.common import AllowedField
 from configparity.fields.common import BoolField
 from configparity.fields.common import DictField
@@ -36,8 +37,74 @@ CLASSES = [
     'ssl', 'svc', 'sys', 'vm', 'vpdn', 'vpn', 'vpnc', 'vpnfo',
     'vpnlb', 'webfo', 'webvpn']
 
+"""
+The nested validators of the dict fields below are built by these functions
+the first time each field is used, rather than when this module is imported,
+so loading a config without logging never builds them.
+"""
+
+
+def _class_fields():
+    # This creates the validators for the individual
+    #  levels within the multilayer dict "classes"
+    # Tuples within tuples within tuples,
+    #  using list comprension to make the keys!
+    return [(
+        logging_class,
+        DictField(allowed=[(
+            level_type,
+            StrField(allowed=[v for k, v in LEVELS.items()])
+        ) for level_type in LEVEL_TYPES])
+    ) for logging_class in CLASSES]
+
+
+def _host_fields():
+    return [
+        ('interface', StrField()),
+        ('address', AllowedField([
+            IPAddressField(),
+            StrField()])),
+        ('protocol', AllowedField([
+            IntField(low=6, high=6),  # TCP
+            IntField(low=17, high=17)])),  # UDP
+        ('port', IntField(low=1, high=65535)),
+        ('secure', BoolField(default=False)),
+        ('format', StrField(allowed=['emblem']))]
+
+
+def _list_fields():
+    return [
+        ('name', StrField()),
+        ('level', StrField(allowed=[v for k, v in LEVELS.items()])),
+        ('message', IntField(low=100000, high=999999)),
+        ('class', StrField(allowed=list(CLASSES)))]
+
+
+def _message_fields():
+    return [
+        ('level', StrField(allowed=[v for k, v in LEVELS.items()])),
+        ('message', IntField(low=100000, high=999999)),
+        ('no', BoolField(default=False))]
+
+
+def _rate_limit_fields():
+    return [
+        ('number', IntField(low=1, high=2147483647)),
+        ('unlimited', BoolField(default=False)),
+        ('interval', IntField(low=1, high=2147483647)),
+        ('message', IntField(low=100000, high=999999)),
+        ('level', IntField(low=0, high=7))]
+
+
+def _recipient_address_fields():
+    return [
+        ('level', StrField(allowed=[v for k, v in LEVELS.items()])),
+        ('email', EmailField())]
+
 
 class Logging(Model):
+    __slots__ = ()
+
     asdm = AllowedField([
         StrField(allowed=[v for k, v in LEVELS.items()]),
         StrField()])
@@ -48,17 +115,7 @@ class Logging(Model):
         StrField()])
 
     # Holy crap, the level of inception here...
-    # This creates the validators for the individual
-    #  levels within the multilayer dict "classes"
-    # Tuples within tuples within tuples,
-    #  using list comprension to make the keys!
-    classes = DictField(allowed=[(
-        logging_class,
-        DictField(allowed=[(
-            level_type,
-            StrField(allowed=[v for k, v in LEVELS.items()])
-        ) for level_type in LEVEL_TYPES])
-    ) for logging_class in CLASSES])
+    classes = DictField(allowed=_class_fields)
 
     console = AllowedField([
         StrField(allowed=[v for k, v in LEVELS.items()]),
@@ -85,28 +142,10 @@ class Logging(Model):
         StrField()])
 
     # This craziness is also adding validation to a list of dicts
-    hosts = ListField(
-        list_type=DictField(
-            allowed=[
-                ('interface', StrField()),
-                ('address', AllowedField([
-                    IPAddressField(),
-                    StrField()])),
-                ('protocol', AllowedField([
-                    IntField(low=6, high=6),  # TCP
-                    IntField(low=17, high=17)])),  # UDP
-                ('port', IntField(low=1, high=65535)),
-                ('secure', BoolField(default=False)),
-                ('format', StrField(allowed=['emblem']))]))
+    hosts = ListField(list_type=DictField(allowed=_host_fields))
 
     # Some more of the same craziness that hosts is doing, but for lists!
-    lists = ListField(
-        list_type=DictField(
-            allowed=[
-                ('name', StrField()),
-                ('level', StrField(allowed=[v for k, v in LEVELS.items()])),
-                ('message', IntField(low=100000, high=999999)),
-                ('class', StrField(c for c in CLASSES))]))
+    lists = ListField(list_type=DictField(allowed=_list_fields))
 
     mail = AllowedField([
         StrField(allowed=[v for k, v in LEVELS.items()]),
@@ -115,12 +154,7 @@ class Logging(Model):
     # Screw you, Cisco, for this level of complexity!
     # On a similar note, thank you, Cisco, for this level of customization!
     # Just more validation to a list of dicts
-    messages = ListField(
-        list_type=DictField(
-            allowed=[
-                ('level', StrField(allowed=[v for k, v in LEVELS.items()])),
-                ('message', IntField(low=100000, high=999999)),
-                ('no', BoolField(default=False))]))
+    messages = ListField(list_type=DictField(allowed=_message_fields))
 
     monitor = AllowedField([
         StrField(allowed=[v for k, v in LEVELS.items()]),
@@ -130,24 +164,13 @@ class Logging(Model):
 
     # Understanding this logging stuff is love/hate
     # Yet more validation to a list of dicts
-    rate_limits = ListField(
-        list_type=DictField(
-            allowed=[
-                ('number', IntField(low=1, high=2147483647)),
-                ('unlimited', BoolField(default=False)),
-                ('interval', IntField(low=1, high=2147483647)),
-                ('message', IntField(low=100000, high=999999)),
-                ('level', IntField(low=0, high=7))]))
+    rate_limits = ListField(list_type=DictField(allowed=_rate_limit_fields))
 
     # Because you can have multiple loggin levels sent to multiple email addresses,
     #  you need to be able to store multiple recipient-addresses. Which means
     #  this code you see has to validate this stuff, so here you go, more
     #  validator barf...
-    recipient_addresses = ListField(
-        list_type=DictField(
-            allowed=[
-                ('level', StrField(allowed=[v for k, v in LEVELS.items()])),
-                ('email', EmailField())]))
+    recipient_addresses = ListField(list_type=DictField(allowed=_recipient_address_fields))
 
     standby = BoolField(default=False)
     timestamp = BoolField(default=False)
@@ -339,7 +362,7 @@ class Logging(Model):
         return config
 
     def load_config(self, config_str):
-        config_lines = [l for l in config_str.splitlines() if l.startswith('logging')]
+        config_lines = [l for l in read_lines(config_str) if l.startswith('logging')]
         config = {}
 
         if len(config_lines) == 0:
@@ -653,10 +676,8 @@ class Logging(Model):
                 value = getattr(self, field)
 
             if value:
-                try:
-                    default = object.__getattribute__(self, field).default
-                except Exception:
-                    default = None
+                field_instance = self.get_field_instance(field)
+                default = field_instance.default if field_instance else None
 
                 if default and value == default:
                     continue
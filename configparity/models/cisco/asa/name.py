@@ -1,9 +1,12 @@
 from configparity.models import Model
+from configparity.models import first_words
 from configparity.fields.common import StrField
 from configparity.fields.networking import IPAddressField
 
 
 class Name(Model):
+    __slots__ = ()
+
     name = StrField()
     ip_address = IPAddressField()
 
@@ -14,7 +17,7 @@ class Name(Model):
         return self.config
 
     def load_config(self, config_str):
-        config_str = config_str.split(' ')
+        config_str = first_words(config_str)
 
         is_valid = all([
             config_str[0] == 'name',
@@ -1,4 +1,5 @@
 from configparity.models import Model
+from configparity.models import first_words
 from configparity.fields.common import AllowedField
 from configparity.fields.common import BoolField
 from configparity.fields.common import IntField
@@ -8,6 +9,8 @@ from configparity.fields.networking import IPNetworkField
 
 
 class Nat(Model):
+    __slots__ = ()
+
     ALLOWED_TYPES = ['static', 'dynamic']
 
     after_auto = BoolField(default=False)
@@ -43,10 +46,10 @@ class Nat(Model):
         return ''
 
     def load_config(self, config_str):
-        config_items = config_str.split(' ') if config_str[0] != ' ' else config_str[1:].split(' ')
+        config_items = first_words(config_str)
         config = {}
 
-        if config_items[0] != 'nat':
+        if config_items[0:1] != ['nat']:
             return None
 
         config_items = config_items[1:]
@@ -1,4 +1,5 @@
 from configparity.models import Model
+from configparity.models import read_tokens
 from configparity.models.cisco import COMMENTS
 from configparity.fields.common import BoolField
 from configparity.fields.common import DictField
@@ -10,6 +11,8 @@ from configparity.fields.networking import IPNetworkField
 
 
 class Object(Model):
+    __slots__ = ()
+
     ALLOWED_TYPES = ['network', 'service']
     BOOL_FIELDS = [
         'call_home',
@@ -55,14 +58,14 @@ class Object(Model):
             'destination': tuple(destination) if len(destination) > 0 else None}
 
     def load_config(self, config_str):
-        config_lines = [(l[1:] if l.startswith(' ') else l) for l in config_str.splitlines()]
+        config_tokens = [token for token in read_tokens(config_str) if token.words]
         config = {}
 
-        if config_lines[0].split(' ')[0] != 'object':
+        if not config_tokens or config_tokens[0].words[0] != 'object':
             return None
 
-        for line in config_lines:
-            line = line.split(' ')
+        for token in config_tokens:
+            line = list(token.words)
             field = line[0].replace('-', '_')
 
             if field in COMMENTS:
@@ -1,14 +1,18 @@
 from configparity.models import Model
+from configparity.models import read_tokens
 from configparity.models.cisco import COMMENTS
 from configparity.fields.common import AllowedField
 from configparity.fields.common import DictField
 from configparity.fields.common import ListField
 from configparity.fields.common import StrField
+from configparity.fields.networking import CompactIPList
 from configparity.fields.networking import IPAddressField
 from configparity.fields.networking import IPNetworkField
 
 
 class ObjectGroup(Model):
+    __slots__ = ()
+
     ALLOWED_TYPES = [
         'icmp-type',
         'network',
@@ -21,7 +25,8 @@ class ObjectGroup(Model):
     group_objects = ListField(default=[], list_type=StrField())
     icmp_objects = ListField(default=[], list_type=StrField())
     name = StrField()
-    network_objects = ListField(default=[], list_type=AllowedField([
+    # Network groups can hold a great many addresses, so they are kept packed
+    network_objects = ListField(default=[], list_class=CompactIPList, list_type=AllowedField([
         IPAddressField(),
         IPNetworkField(),
         StrField()]))
@@ -70,11 +75,11 @@ class ObjectGroup(Model):
             'destination': tuple(destination) if len(destination) > 0 else None}
 
     def load_config(self, config_str):
-        config_lines = [(l[1:] if l.startswith(' ') else l) for l in config_str.splitlines()]
+        config_tokens = [token for token in read_tokens(config_str) if token.words]
         config = {}
 
-        for line in config_lines:
-            line = line.split(' ')
+        for token in config_tokens:
+            line = list(token.words)
             field = line[0]
 
             if field in COMMENTS:
@@ -1,4 +1,5 @@
 from configparity.models import Model
+from configparity.models import first_words
 from configparity.fields.common import IntField
 from configparity.fields.common import StrField
 from configparity.fields.networking import IPAddressField
@@ -6,6 +7,8 @@ from configparity.fields.networking import IPNetworkField
 
 
 class Route(Model):
+    __slots__ = ()
+
     method = StrField(default='static')
     if_name = StrField()
     route = IPNetworkField()
@@ -19,7 +22,7 @@ class Route(Model):
         return self.config
 
     def load_config(self, config_str):
-        config_str = config_str.split(' ')
+        config_str = first_words(config_str)
 
         is_valid = any([
             all([
@@ -1,10 +1,13 @@
 from configparity.models import Model
+from configparity.models import read_lines
 from configparity.fields.common import StrField
 from configparity.fields.common import IntField
 from configparity.fields.common import BoolField
 
 
 class Vlan(Model):
+    __slots__ = ()
+
     name = StrField()
     number = IntField(low=1, high=4094)
     shutdown = BoolField(default=False)
@@ -13,7 +16,7 @@ class Vlan(Model):
         return self.config
 
     def load_config(self, config_str):
-        config_lines = [(l[1:] if l.startswith(' ') else l) for l in config_str.splitlines()]
+        config_lines = [(l[1:] if l.startswith(' ') else l) for l in read_lines(config_str)]
 
         config = {}
 
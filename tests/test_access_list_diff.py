@@ -0,0 +1,131 @@
+from configparity.models.cisco.asa import ASA
+from configparity.models.cisco.asa.access_list import AccessList
+import os
+import unittest
+from unittest import mock
+
+"""
+AccessList.diff is Myers' diff of the entries an access list was loaded with
+and the ones it has now, which only_changes renders into the commands that
+turn the one into the other.
+"""
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'samples', 'cisco', 'asa', '5508_9.8.config')
+
+with open(SAMPLE) as sample:
+    CONFIG = sample.read()
+
+
+class CappedAccessList(AccessList):
+    DIFF_MAX_EDITS = 1
+
+
+def apply(ops):
+    return [item for op, item in ops if op != 'delete']
+
+
+class DiffTest(unittest.TestCase):
+    def assert_diff(self, initial, current, expected):
+        ops = AccessList.diff(list(initial), list(current))
+
+        self.assertEqual(ops, expected)
+        self.assertEqual(apply(ops), list(current))
+        self.assertEqual([item for op, item in ops if op != 'insert'], list(initial))
+
+    def test_insert(self):
+        self.assert_diff('abc', 'abxc', [('equal', 'a'), ('equal', 'b'), ('insert', 'x'), ('equal', 'c')])
+
+    def test_delete(self):
+        self.assert_diff('abc', 'ac', [('equal', 'a'), ('delete', 'b'), ('equal', 'c')])
+
+    def test_reorder(self):
+        self.assert_diff('abcd', 'acbd', [
+            ('equal', 'a'), ('delete', 'b'), ('equal', 'c'), ('insert', 'b'), ('equal', 'd')])
+
+    def test_rename(self):
+        self.assert_diff('abc', 'axc', [('equal', 'a'), ('delete', 'b'), ('insert', 'x'), ('equal', 'c')])
+
+    def test_edit_cap(self):
+        ops = CappedAccessList.diff(list('abc'), list('xbcy'))
+
+        self.assertEqual(ops, [('delete', item) for item in 'abc'] + [('insert', item) for item in 'xbcy'])
+        self.assertEqual(AccessList.diff(list('abc'), list('xbcy')), [
+            ('delete', 'a'), ('insert', 'x'), ('equal', 'b'), ('equal', 'c'), ('insert', 'y')])
+
+
+class EntriesChangesTest(unittest.TestCase):
+    def entries(self, lazy=False):
+        asa = ASA(from_config=CONFIG, lazy=lazy)
+
+        return asa, asa.access_list.entries
+
+    def test_insert(self):
+        asa, entries = self.entries()
+        entries.insert(1, 'access-list OUTSIDE extended permit ip any host 10.0.0.1')
+
+        self.assertEqual(asa.only_changes, 'access-list OUTSIDE line 2 extended permit ip any 10.0.0.1')
+
+    def test_delete(self):
+        asa, entries = self.entries()
+        del entries[1]
+
+        self.assertEqual(asa.only_changes, 'no access-list OUTSIDE extended permit object-group WEB-PORTS '
+                                           'object-group NETWORK-10DOT object-group VLAN-192-SERVERS')
+
+    def test_reorder(self):
+        asa, entries = self.entries()
+        entries.insert(2, entries.pop(0))
+
+        # A moved entry is removed before it is added back in its new place
+        self.assertEqual(asa.only_changes.splitlines(), [
+            'no access-list OUTSIDE extended permit icmp any any object-group ICMP-ALLOWED',
+            'access-list OUTSIDE line 3 extended permit icmp any any object-group ICMP-ALLOWED'])
+
+    def test_rename(self):
+        asa, entries = self.entries()
+        entries[0] = 'access-list RENAMED extended permit icmp any any object-group ICMP-ALLOWED'
+
+        self.assertEqual(asa.only_changes.splitlines(), [
+            'access-list RENAMED line 1 extended permit icmp any any object-group ICMP-ALLOWED',
+            'no access-list OUTSIDE extended permit icmp any any object-group ICMP-ALLOWED'])
+
+    def test_edit_cap(self):
+        asa, entries = self.entries()
+        entries.insert(0, 'access-list OUTSIDE extended permit ip any host 10.0.0.1')
+        entries.insert(3, 'access-list OUTSIDE extended permit ip any host 10.0.0.2')
+
+        with mock.patch.object(AccessList, 'DIFF_MAX_EDITS', 1):
+            lines = asa.access_list._entries_changes()
+
+        # Past the cap the differing part of each access list is replaced as a whole
+        self.assertEqual(lines, [
+            'no access-list OUTSIDE extended permit icmp any any object-group ICMP-ALLOWED',
+            'no access-list OUTSIDE extended permit object-group WEB-PORTS object-group NETWORK-10DOT '
+            'object-group VLAN-192-SERVERS',
+            'access-list OUTSIDE line 1 extended permit ip any 10.0.0.1',
+            'access-list OUTSIDE line 2 extended permit icmp any any object-group ICMP-ALLOWED',
+            'access-list OUTSIDE line 3 extended permit object-group WEB-PORTS object-group NETWORK-10DOT '
+            'object-group VLAN-192-SERVERS',
+            'access-list OUTSIDE line 4 extended permit ip any 10.0.0.2'])
+        self.assertEqual(asa.access_list._entries_changes(), [
+            'access-list OUTSIDE line 1 extended permit ip any 10.0.0.1',
+            'access-list OUTSIDE line 4 extended permit ip any 10.0.0.2'])
+
+    def test_edited_entries(self):
+        for lazy in (False, True):
+            asa, entries = self.entries(lazy)
+            entries[4].destination_port = 'eq 22'
+
+            self.assertNotIn('entries', asa.access_list._changed_fields)
+            self.assertEqual(asa.only_changes.splitlines(), [
+                'access-list FW-VLAN-10 line 3 extended deny ip any object-group INSIDE-NETWORKS eq 22',
+                'no access-list FW-VLAN-10 extended deny ip any object-group INSIDE-NETWORKS'])
+
+            # Only the edited entry of a lazy access list is built to list the changes
+            if lazy:
+                self.assertEqual([index for index in range(len(entries)) if entries.is_built(index)], [4])
+
+
+if __name__ == '__main__':
+    unittest.main()
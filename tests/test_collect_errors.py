@@ -0,0 +1,61 @@
+from configparity.fields import FieldValueException
+from configparity.models.cisco.asa import ASA
+import os
+import unittest
+
+"""
+An ASA created with collect_errors leaves out the parts of the config it
+refuses and reports each of them, instead of raising on the first one.
+"""
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'samples', 'cisco', 'asa', '5508_9.8.config')
+
+with open(SAMPLE) as sample:
+    CONFIG = sample.read()
+
+BAD_NAME = 'name 300.1.1.1 BAD'
+BAD_ROUTE = 'route OUTSIDE 10.0.0.0 255.0.0.0 999.1.1.1 1'
+
+
+def broken_config():
+    lines = CONFIG.split('\n')
+    lines.insert(lines.index('name 172.16.0.0 Private172dot'), BAD_NAME)
+
+    # Away from the other route, so it is a section of its own
+    lines.insert(lines.index('access-group FW-VLAN-192 in interface FW-VLAN-192'), BAD_ROUTE)
+
+    return '\n'.join(lines), lines.index(BAD_NAME) + 1, lines.index(BAD_ROUTE) + 1
+
+
+class CollectErrorsTest(unittest.TestCase):
+    def test_errors_are_reported(self):
+        config, name_line, route_line = broken_config()
+        asa = ASA(from_config=config, collect_errors=True)
+
+        self.assertEqual([(error.field, error.value, error.line) for error in asa.load_errors], [
+            ('name', BAD_NAME, name_line),
+            ('route', BAD_ROUTE, route_line)])
+
+        for error in asa.load_errors:
+            self.assertIn('999.1.1.1' if error.field == 'route' else '300.1.1.1', error.message)
+
+    def test_good_sections_load(self):
+        config, _, _ = broken_config()
+        asa = ASA(from_config=config, collect_errors=True)
+        clean = ASA(from_config=CONFIG)
+
+        self.assertEqual([str(name) for name in asa.name], [str(name) for name in clean.name])
+        self.assertEqual([route.config for route in asa.route], [route.config for route in clean.route])
+        self.assertEqual(asa.config, clean.config)
+        self.assertFalse(asa.has_changes)
+
+    def test_raises_without_collect_errors(self):
+        config, _, _ = broken_config()
+
+        with self.assertRaises(FieldValueException):
+            ASA(from_config=config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+from configparity.fields.networking import CompactIPList
+import copy
+import ipaddress
+import pickle
+import random
+import unittest
+
+"""
+CompactIPList keeps its IPv4 items packed in arrays, alongside the list
+slots, so every list operation has to keep the three in step. These tests
+run the same random operations on a CompactIPList and a plain list and
+check that both always hold the same items.
+"""
+
+
+class CompactIPListTest(unittest.TestCase):
+    STEPS = 20000
+
+    def setUp(self):
+        self.random = random.Random(1)
+
+    def value(self):
+        kind = self.random.randrange(4)
+
+        if kind == 0:
+            return ipaddress.IPv4Address(self.random.randrange(2 ** 32))
+
+        if kind == 1:
+            return ipaddress.IPv4Network((self.random.randrange(256) << 24, 8))
+
+        if kind == 2:
+            return ipaddress.IPv6Address(self.random.randrange(2 ** 128))
+
+        return self.random.choice(['any', 'object X', 'host y'])
+
+    def index(self, values):
+        return self.random.randrange(-len(values), len(values))
+
+    def apply(self, expected, compact, operation):
+        value = self.value()
+
+        if operation == 0:
+            expected.append(value)
+            compact.append(value)
+
+        elif operation == 1:
+            index = self.random.randrange(-5, 10)
+            expected.insert(index, value)
+            compact.insert(index, value)
+
+        elif operation == 2:
+            index = self.index(expected)
+            expected[index] = value
+            compact[index] = value
+
+        elif operation == 3:
+            index = self.index(expected)
+            self.assertEqual(expected.pop(index), compact.pop(index))
+
+        elif operation == 4:
+            values = [self.value() for _ in range(3)]
+            expected.extend(values)
+            compact += values
+
+        else:
+            self.apply_rearranging(expected, compact, operation)
+
+    def apply_rearranging(self, expected, compact, operation):
+        if operation == 5:
+            start = self.random.randrange(len(expected))
+            stop = self.random.randrange(start, len(expected) + 1)
+            values = [self.value() for _ in range(self.random.randrange(4))]
+            expected[start:stop] = values
+            compact[start:stop] = values
+
+        elif operation == 6:
+            index = self.random.randrange(len(expected))
+            del expected[index:index + 2]
+            del compact[index:index + 2]
+
+        elif operation == 7:
+            expected.reverse()
+            compact.reverse()
+
+        elif operation == 8:
+            value = self.random.choice(expected)
+            expected.remove(value)
+            compact.remove(value)
+
+        elif operation == 9:
+            expected.sort(key=str)
+            compact.sort(key=str)
+
+        elif operation == 10:
+            del expected[::3]
+            del compact[::3]
+
+    def assert_same(self, expected, compact):
+        self.assertEqual(list(compact), expected)
+        self.assertEqual(compact, expected)
+        self.assertEqual(len(compact._addresses), len(expected))
+        self.assertEqual(len(compact._prefixes), len(expected))
+
+        if expected:
+            self.assertEqual(compact[-1], expected[-1])
+            self.assertEqual(compact[1:4], expected[1:4])
+            self.assertEqual(list(reversed(compact)), list(reversed(expected)))
+
+    def test_random_operations(self):
+        expected = []
+        compact = CompactIPList()
+
+        for _ in range(self.STEPS):
+            operation = self.random.randrange(12)
+
+            # Operations that need items, or that are slow on long lists, are only run some of the time
+            if operation in (2, 3, 5, 6, 8) and not expected:
+                continue
+
+            if operation == 9 and self.random.random() >= 0.02:
+                continue
+
+            if operation == 10 and len(expected) <= 60:
+                continue
+
+            if operation == 11:
+                if self.random.random() < 0.01:
+                    compact = copy.deepcopy(pickle.loads(pickle.dumps(compact)))
+
+                continue
+
+            self.apply(expected, compact, operation)
+            self.assert_same(expected, compact)
+
+    def test_items_are_read_as_the_same_object(self):
+        compact = CompactIPList([
+            ipaddress.IPv4Address('10.0.0.1'),
+            ipaddress.IPv4Network('10.1.0.0/16'),
+            'object X'])
+
+        for index in range(len(compact)):
+            self.assertIs(compact[index], compact[index])
+
+        self.assertEqual([id(item) for item in compact], [id(item) for item in compact.stored_items()])
+
+
+if __name__ == '__main__':
+    unittest.main()
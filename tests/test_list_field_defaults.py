@@ -0,0 +1,54 @@
+from configparity.fields import FieldValueException
+from configparity.fields.common import TrackedList
+from configparity.fields.networking import CompactIPList
+from configparity.models.cisco.asa.object_group import ObjectGroup
+import ipaddress
+import unittest
+
+"""
+A ListField that has not been set hands each model a list of its own for
+its default, so what is added to it is converted and tracked like any
+other list value, and the class default is never changed.
+"""
+
+CONFIG = 'object-group network EMPTY'
+
+
+class ListFieldDefaultTest(unittest.TestCase):
+    def test_default_is_a_tracked_list_of_the_model(self):
+        group = ObjectGroup(from_config=CONFIG)
+
+        self.assertIsInstance(group.network_objects, CompactIPList)
+        self.assertIsInstance(group.service_objects, TrackedList)
+        self.assertIs(group.network_objects, group.network_objects)
+        self.assertIsNot(group.network_objects, ObjectGroup(from_config=CONFIG).network_objects)
+
+    def test_items_added_to_the_default_are_converted_and_tracked(self):
+        group = ObjectGroup(from_config=CONFIG)
+        self.assertFalse(group.has_changes)
+
+        group.network_objects.append('10.1.1.1')
+
+        self.assertEqual(group.network_objects, [ipaddress.IPv4Address('10.1.1.1')])
+        self.assertTrue(group.has_changes)
+
+    def test_items_the_field_refuses_are_not_added(self):
+        group = ObjectGroup(from_config=CONFIG)
+
+        with self.assertRaises(FieldValueException):
+            group.service_objects.append('not a service at all!!')
+
+        self.assertEqual(group.service_objects, [])
+
+    def test_class_default_is_left_alone(self):
+        group = ObjectGroup(from_config=CONFIG)
+        group.network_objects.append('10.1.1.1')
+        group.service_objects.append({'protocol': 'tcp'})
+
+        self.assertEqual(ObjectGroup.network_objects.default, [])
+        self.assertEqual(ObjectGroup.service_objects.default, [])
+        self.assertEqual(ObjectGroup(from_config=CONFIG).network_objects, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
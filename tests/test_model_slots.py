@@ -0,0 +1,57 @@
+from configparity.models.cisco.asa import ASA
+import os
+import pickle
+import unittest
+
+"""
+Models keep their state in slots, with no __dict__, and a child model's
+reference to the model it belongs to is kept only in its values.
+"""
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'samples', 'cisco', 'asa', '5508_9.8.config')
+
+
+def models(asa):
+    yield asa
+    yield asa.access_list
+    yield from asa.access_list.entries
+
+    for field in ['access_group', 'interface', 'name', 'object', 'object_group', 'route']:
+        yield from getattr(asa, field)
+
+
+class ModelSlotsTest(unittest.TestCase):
+    def assert_no_dict(self, asa):
+        for model in models(asa):
+            self.assertFalse(hasattr(model, '__dict__'), type(model).__name__)
+
+    def test_loaded_models(self):
+        for lazy in (False, True):
+            self.assert_no_dict(ASA.from_file(SAMPLE, lazy=lazy))
+
+    def test_back_references(self):
+        asa = ASA.from_file(SAMPLE)
+        entry = asa.access_list.entries[0]
+
+        self.assertIs(asa.access_list.asa, asa)
+        self.assertIs(entry.access_list, asa.access_list)
+        self.assertIs(entry.values['access_list'], asa.access_list)
+        self.assertIs(asa.object[0].asa, asa)
+
+        with self.assertRaises(AttributeError):
+            entry.missing
+
+    def test_pickled_models(self):
+        asa = pickle.loads(pickle.dumps(ASA.from_file(SAMPLE)))
+
+        self.assert_no_dict(asa)
+        self.assertIs(asa.access_list.asa, asa)
+        self.assertIsInstance(asa.object[0]._source, bytes)
+        self.assertIsNone(asa.workers)
+        self.assertEqual(asa.load_errors, [])
+        self.assertEqual(asa.config, ASA.from_file(SAMPLE).config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+from configparity.cache import ParseCache
+from configparity.models.cisco.asa import ASA
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+"""
+ParseCache keeps parsed models on disk, keyed by a hash of their config, so
+an unchanged config is loaded from its snapshot instead of parsed again.
+"""
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'samples', 'cisco', 'asa', '5508_9.8.config')
+
+with open(SAMPLE) as sample:
+    CONFIG = sample.read()
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_miss_then_hit(self):
+        key = self.cache.key(ASA, CONFIG, ASA()._cache_options())
+
+        self.assertIsNone(self.cache.get(key))
+
+        parsed = ASA(from_config=CONFIG, cache=self.cache)
+
+        self.assertEqual(len(self.cache.entries()), 1)
+
+        # A hit loads the snapshot without parsing the config
+        with mock.patch.object(ASA, '_load_config', side_effect=AssertionError('parsed again')):
+            cached = ASA(from_config=CONFIG, cache=self.cache)
+            from_file = ASA.from_file(SAMPLE, cache=self.cache)
+
+        self.assertEqual(cached.config, parsed.config)
+        self.assertEqual(from_file.config, parsed.config)
+
+    def test_options_and_config_are_part_of_the_key(self):
+        ASA(from_config=CONFIG, cache=self.cache)
+        ASA(from_config=CONFIG, cache=self.cache, lazy=True)
+        ASA(from_config=CONFIG.replace('hostname ', 'hostname other-', 1), cache=self.cache)
+
+        self.assertEqual(len(self.cache.entries()), 3)
+
+    def test_version_change_invalidates(self):
+        with mock.patch.object(ParseCache, '_version', 'a' * 16):
+            ASA(from_config=CONFIG, cache=self.cache)
+            key = self.cache.key(ASA, CONFIG, ASA()._cache_options())
+
+            self.assertIsNotNone(self.cache.get(key))
+
+        with mock.patch.object(ParseCache, '_version', 'b' * 16):
+            self.assertIsNone(self.cache.get(key))
+
+            ASA(from_config=CONFIG, cache=self.cache)
+
+            # Putting an entry for the new version removes the entries of the old one
+            self.assertEqual(os.listdir(self.directory.name), ['b' * 16])
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.max_entries = 2
+
+        for number, key in enumerate(['first', 'second']):
+            self.cache.put(key, number)
+            os.utime(self.cache._entry_path(key), (1000 + number, 1000 + number))
+
+        # Reading the oldest entry makes it the most recently used
+        self.assertEqual(self.cache.get('first'), 0)
+
+        self.cache.put('third', 2)
+
+        self.assertIsNone(self.cache.get('second'))
+        self.assertEqual(self.cache.get('first'), 0)
+        self.assertEqual(self.cache.get('third'), 2)
+
+    def test_max_bytes(self):
+        self.cache.max_bytes = 1
+
+        self.cache.put('first', 0)
+
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_cached_model_is_usable(self):
+        ASA.from_file(SAMPLE, cache=self.cache)
+        asa = ASA.from_file(SAMPLE, cache=self.cache)
+
+        # Back-references point at the ASA the snapshot was loaded into
+        self.assertIs(asa.access_list.asa, asa)
+        self.assertIs(asa.object[0].asa, asa)
+
+        for entry in asa.access_list.entries:
+            self.assertIs(entry.access_list, asa.access_list)
+
+        self.assertFalse(asa.has_changes)
+        self.assertEqual(asa.only_changes, '')
+
+        parsed = ASA(from_config=CONFIG)
+
+        for model in (asa, parsed):
+            model.hostname = 'edited'
+            model.object[0].description = 'edited'
+            model.access_list.entries.pop(0)
+
+        self.assertEqual(asa.only_changes, parsed.only_changes)
+        self.assertIn('hostname edited', asa.only_changes)
+
+
+if __name__ == '__main__':
+    unittest.main()
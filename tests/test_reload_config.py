@@ -0,0 +1,140 @@
+from configparity.models.cisco.asa import ASA
+import os
+import unittest
+
+"""
+reload_config rebuilds only the section models whose text changed, which it
+tells from a digest each model keeps of the text it was built from.
+"""
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'samples', 'cisco', 'asa', '5508_9.8.config')
+
+with open(SAMPLE) as sample:
+    CONFIG = sample.read()
+
+EDITED = CONFIG.replace(' host 10.128.0.10\n', ' host 10.128.0.11\n', 1)
+ACE_EDITED = CONFIG.replace('access-list FW-VLAN-10 extended deny ip any object-group INSIDE-NETWORKS',
+                            'access-list FW-VLAN-10 extended deny tcp any object-group INSIDE-NETWORKS', 1)
+WITHOUT_ROUTES = '\n'.join(line for line in CONFIG.splitlines() if not line.startswith('route '))
+
+
+class ReloadConfigTest(unittest.TestCase):
+    def load(self):
+        asa = ASA(from_config=CONFIG)
+        kept = {'object': list(asa.object), 'interface': list(asa.interface), 'route': list(asa.route)}
+
+        return asa, kept
+
+    def assert_kept(self, asa, kept, field, but=()):
+        for index, (before, after) in enumerate(zip(kept[field], getattr(asa, field))):
+            if index in but:
+                self.assertIsNot(before, after)
+            else:
+                self.assertIs(before, after)
+
+    def test_sources_are_digests(self):
+        asa = ASA(from_config=CONFIG)
+
+        self.assertIsInstance(asa.object[0]._source, bytes)
+        self.assertIsInstance(asa.access_list._source, bytes)
+        self.assertLessEqual(len(asa.access_list._source), 16)
+
+    def test_no_changes(self):
+        asa, kept = self.load()
+        access_list = asa.access_list
+
+        asa.reload_config(CONFIG)
+
+        for field in kept:
+            self.assert_kept(asa, kept, field)
+
+        self.assertIs(asa.access_list, access_list)
+        self.assertFalse(asa.has_changes)
+        self.assertEqual(asa.only_changes, '')
+
+    def test_one_edited_line(self):
+        asa, kept = self.load()
+        index = next(i for i, item in enumerate(asa.object) if str(item.host) == '10.128.0.10')
+
+        asa.reload_config(EDITED)
+
+        self.assert_kept(asa, kept, 'object', but=[index])
+        self.assert_kept(asa, kept, 'interface')
+        self.assertEqual(str(asa.object[index].host), '10.128.0.11')
+        self.assertIn('host 10.128.0.11', asa.only_changes)
+        self.assertNotIn('interface', asa.only_changes)
+        self.assertEqual(asa.config, ASA(from_config=EDITED).config)
+
+    def test_removed_section(self):
+        asa, kept = self.load()
+
+        asa.reload_config(WITHOUT_ROUTES)
+
+        self.assertEqual(list(asa.route), [])
+        self.assert_kept(asa, kept, 'object')
+        self.assertEqual(asa.only_changes, '\n'.join(f'no {route.config}' for route in kept['route']))
+        self.assertEqual(asa.config, ASA(from_config=WITHOUT_ROUTES).config)
+
+    def test_locally_edited_model_is_rebuilt(self):
+        asa, kept = self.load()
+        asa.object[3].description = 'edited here'
+
+        asa.reload_config(CONFIG)
+
+        self.assert_kept(asa, kept, 'object', but=[3])
+        self.assertIsNone(asa.object[3].description)
+        self.assertEqual(asa.object[3].config, ASA(from_config=CONFIG).object[3].config)
+        self.assertEqual(asa.config, ASA(from_config=CONFIG).config)
+
+
+class LazyReloadConfigTest(unittest.TestCase):
+    def built(self, values):
+        return sum(values.is_built(index) for index in range(len(values)))
+
+    def test_no_changes(self):
+        asa = ASA(from_config=CONFIG, lazy=True)
+
+        asa.reload_config(CONFIG)
+
+        self.assertFalse(asa.has_changes)
+        self.assertEqual(asa.only_changes, '')
+        self.assertEqual(self.built(asa.values['object']), 0)
+        self.assertEqual(asa.config, ASA(from_config=CONFIG, lazy=True).config)
+
+    def test_read_items_are_kept(self):
+        asa = ASA(from_config=CONFIG, lazy=True)
+        objects = list(asa.object)
+
+        asa.reload_config(CONFIG)
+
+        self.assertEqual(asa.only_changes, '')
+
+        for before, after in zip(objects, asa.object):
+            self.assertIs(before, after)
+
+    def test_one_edited_line(self):
+        asa = ASA(from_config=CONFIG, lazy=True)
+        eager = ASA(from_config=CONFIG)
+
+        asa.reload_config(EDITED)
+        eager.reload_config(EDITED)
+
+        self.assertEqual(asa.only_changes, eager.only_changes)
+        self.assertIn('host 10.128.0.11', asa.only_changes)
+        self.assertEqual(self.built(asa.values['object']), 1)
+        self.assertEqual(asa.config, ASA(from_config=EDITED, lazy=True).config)
+
+    def test_one_edited_entry(self):
+        asa = ASA(from_config=CONFIG, lazy=True)
+
+        asa.reload_config(ACE_EDITED)
+
+        self.assertEqual(asa.only_changes.splitlines(), [
+            'access-list FW-VLAN-10 line 3 extended deny tcp any object-group INSIDE-NETWORKS',
+            'no access-list FW-VLAN-10 extended deny ip any object-group INSIDE-NETWORKS'])
+        self.assertEqual(asa.config, ASA(from_config=ACE_EDITED, lazy=True).config)
+
+
+if __name__ == '__main__':
+    unittest.main()
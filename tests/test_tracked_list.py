@@ -0,0 +1,64 @@
+from configparity.models.cisco.asa import ASA
+from configparity.models.cisco.asa.object_group import ObjectGroup
+import os
+import unittest
+
+"""
+A list a ListField stores tells its model of a change before it is made,
+so only_changes can compare with the list as it was. A change the list
+refuses has to leave the model as it was.
+"""
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'samples', 'cisco', 'asa', '5508_9.8.config')
+
+
+class RefusedChangeTest(unittest.TestCase):
+    def lists(self):
+        """
+        Yields a model and a list of it that holds items: an eager and a lazy
+        list of routes, and a packed list of network objects
+        """
+        for lazy in (False, True):
+            asa = ASA.from_file(SAMPLE, lazy=lazy)
+            yield asa, asa.route
+
+        group = ObjectGroup(from_config='object-group network SERVERS\n network-object host 10.0.0.1')
+        yield group, group.network_objects
+
+    def assert_refused(self, error, change):
+        for model, values in self.lists():
+            length = len(values)
+
+            with self.assertRaises(error):
+                change(values)
+
+            self.assertEqual(len(values), length)
+            self.assertFalse(model.has_changes)
+
+    def test_remove_missing_item(self):
+        self.assert_refused(ValueError, lambda values: values.remove('not in the list'))
+
+    def test_pop_out_of_range(self):
+        self.assert_refused(IndexError, lambda values: values.pop(len(values)))
+
+    def test_del_out_of_range(self):
+        def delete(values):
+            del values[len(values)]
+
+        self.assert_refused(IndexError, delete)
+
+    def test_set_out_of_range(self):
+        def assign(values):
+            values[len(values)] = values[0]
+
+        self.assert_refused(IndexError, assign)
+
+    def test_accepted_change_is_recorded(self):
+        for model, values in self.lists():
+            values.remove(values[0])
+            self.assertTrue(model.has_changes)
+
+
+if __name__ == '__main__':
+    unittest.main()